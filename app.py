@@ -1,16 +1,23 @@
 """AIAAIC Data Quality Inspector v2 - Actionable data quality insights."""
 
-from collections import Counter
+import asyncio
+import copy
+import hashlib
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
+import numpy as np
 import pandas as pd
 import streamlit as st
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
-from rapidfuzz import fuzz
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from markdownify import MarkdownConverter
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel
 
-from src.utils import load_errors, load_incidents, check_consistency, deduplicate_jsonl
+from src.models import AIAAICIncident
+from src.utils import load_errors, load_incidents_parallel, check_consistency, deduplicate_jsonl
 
 # === PAGE CONFIG (must be first Streamlit command) ===
 st.set_page_config(page_title="AIAAIC Inspector", page_icon="🔍", layout="wide")
@@ -19,12 +26,22 @@ st.set_page_config(page_title="AIAAIC Inspector", page_icon="🔍", layout="wide
 
 DATA_PATH = Path("data/aiaaic_incidents.jsonl")
 ERRORS_PATH = Path("data/errors.jsonl")
+PAGE_INDEX_PATH = Path("data/page_cache_urls.txt")  # See converted_page_urls()
 CACHE_TTL = 300  # 5 minutes
+FRAME_CACHE_VERSION = 3  # Bump when load_data() changes the DataFrame layout
 DEFAULT_PAGE_SIZE = 50
+FETCH_TIMEOUT = 10
+FETCH_CONCURRENCY = 16
+PREFETCH_AHEAD = 3  # Inspect records fetched in the background after the current one
+PREFETCH_KEEP = 32  # Prefetched pages held in memory until viewed
 DEFAULT_SIMILARITY_THRESHOLD = 85
+MIN_SIMILARITY_THRESHOLD = 70  # Lowest value on the Values page slider
+MAX_CORRECTION_EDITS = 2  # InDel distance: two missing/extra letters or one substitution
+MIN_CORRECTION_LENGTH = 6  # Shorter values (e.g. "AI" / "ML") are too close to tell apart
 
 LIST_FIELDS = ["countries", "sectors", "deployers", "developers", "system_names",
                "technologies", "purposes", "news_triggers", "issues"]
+CATEGORY_FIELDS = ["occurred"]  # Scalar strings with few distinct values; never IDs or headlines
 
 KNOWN_TYPOS = {
     "Accuracy/reliabiity": "Accuracy/reliability",
@@ -34,23 +51,126 @@ KNOWN_TYPOS = {
     "Surveillanc": "Surveillance",
     "Privacy/surveillance/surveillance": "Privacy/surveillance",
 }
+TYPO_SET = frozenset(KNOWN_TYPOS)
+
+SECTION_STRAINER = SoupStrainer("section")
+# Converts already-parsed soup directly (markdownify() would re-parse serialized HTML)
+MARKDOWN_CONVERTER = MarkdownConverter(heading_style="ATX", strip=["script", "style"])
 
 
 # === DATA LOADING ===
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_data():
-    """Load incidents with cache TTL."""
-    if not DATA_PATH.exists():
+def optimize_dtypes(df):
+    """Shrink column dtypes after loading.
+
+    Numbers are downcast, timestamps parsed, and the CATEGORY_FIELDS columns
+    become categoricals. Other string columns stay as they are: aiaaic_id and
+    headline repeat once records are duplicated, but are concatenated and
+    counted as plain strings. Columns with missing values stay object so that
+    empty() keeps seeing None rather than NaN.
+    """
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            df[col] = pd.to_numeric(series, downcast="float")
+        elif col == "scraped_at":
+            df[col] = pd.to_datetime(series, cache=True)
+        elif col in CATEGORY_FIELDS and (series.map(type) == str).all() and series.nunique() <= len(series) // 2:
+            df[col] = series.astype("category")
+    return df
+
+
+def file_signature(path):
+    """Return a key that changes whenever the file is rewritten ("" if missing)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ""
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def data_signature():
+    """Return a key that changes whenever the data file is rewritten."""
+    return file_signature(DATA_PATH)
+
+
+def frame_cache_path(signature):
+    """Return the on-disk DataFrame cache path for a data signature."""
+    return DATA_PATH.with_name(f"{DATA_PATH.stem}.{signature}.v{FRAME_CACHE_VERSION}.pkl")
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1)
+def load_data(signature):
+    """Load incidents for one version of the data file (see data_signature()).
+
+    Keyed on the file signature, so a rescrape or deduplication is picked up on
+    the next rerun instead of after the TTL; only the current frame is kept.
+    Cached as a shared resource so hits return the same frame without a pickle
+    round-trip. Callers must treat it as read-only (filter/sort into new frames).
+
+    The parsed frame is also kept in a pickle sidecar next to the JSONL file, so
+    TTL expiry and app restarts skip JSON parsing until the data file changes.
+    """
+    if not signature:
         return pd.DataFrame()
-    incidents = list(load_incidents(DATA_PATH))
-    return pd.DataFrame([i.model_dump(mode="json") for i in incidents])
+
+    cache_path = frame_cache_path(signature)
+    if cache_path.exists():
+        try:
+            df = pd.read_pickle(cache_path)
+        except Exception:
+            cache_path.unlink(missing_ok=True)
+        else:
+            _remember_frame_key(df, ("data", signature))
+            return df
+
+    # Single streaming pass into column lists (no list of models + list of dicts).
+    # List-field strings repeat hundreds of times, so share one object per value.
+    # Plain object columns on purpose: pa.table(...).to_pandas(types_mapper=pd.ArrowDtype)
+    # was ~9x slower to build here, and its cells reach apply() as numpy arrays / NA
+    # instead of the lists and None that the page helpers test for.
+    columns = {name: [] for name in AIAAICIncident.model_fields}
+    pool = {}
+    for incident in load_incidents_parallel(DATA_PATH):
+        for name, value in incident.model_dump(mode="json").items():
+            if name in LIST_FIELDS:
+                value = [pool.setdefault(v, v) for v in value]
+            columns[name].append(value)
+    df = optimize_dtypes(pd.DataFrame(columns))
+
+    for stale in DATA_PATH.parent.glob(f"{DATA_PATH.stem}.*.pkl"):
+        stale.unlink(missing_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    df.to_pickle(tmp_path)
+    tmp_path.replace(cache_path)
+    _remember_frame_key(df, ("data", signature))
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def background_executor():
+    """Single worker thread for checks that should not block page renders."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="aiaaic-bg")
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def consistency_future(signature):
+    """Start check_consistency() in the background for one version of the data file.
+
+    Started at app load, so the Consistency page usually finds the report ready;
+    a rewritten file has a new signature and gets a fresh check.
+    """
+    return background_executor().submit(check_consistency, DATA_PATH)
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def load_errs():
-    """Load scraping errors."""
-    if not ERRORS_PATH.exists():
+@st.cache_data(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def load_errs(signature):
+    """Load scraping errors for one version of the errors file."""
+    if not signature:
         return []
     return [e.model_dump(mode="json") for e in load_errors(ERRORS_PATH)]
 
@@ -62,31 +182,46 @@ def empty(v):
     return v is None or (isinstance(v, (list, str)) and len(v) == 0)
 
 
-def has_description(df):
-    """Return boolean mask for rows with non-empty description."""
-    return ~df["description"].apply(empty)
+def value_lengths(series):
+    """Return len() of each value as an int array (0 for nulls).
 
+    Nulls are found with one pd.isna pass; lengths are only taken for the
+    remaining str/list values.
+    """
+    values = series.to_numpy(dtype=object)
+    present = ~pd.isna(values)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    lengths[present] = np.fromiter((len(v) for v in values[present]), dtype=np.int64,
+                                   count=int(present.sum()))
+    return lengths
 
-def has_sources(df):
-    """Return boolean mask for rows with non-empty source_links."""
-    return df["source_links"].apply(lambda x: not empty(x) and len(x) > 0)
+
+def filled(series):
+    """Return boolean mask of non-empty values (vectorized `not empty(v)`)."""
+    return pd.Series(value_lengths(series) > 0, index=series.index)
 
 
-def is_complete(df):
-    """Return boolean mask for rows that are 'complete' (have desc and sources)."""
-    return has_description(df) & has_sources(df)
+def has_description(df):
+    """Return boolean mask for rows with non-empty description."""
+    return filled(df["description"])
 
 
-def is_incomplete(df):
-    """Return boolean mask for rows that are 'incomplete' (missing desc or sources)."""
-    return ~has_description(df) | ~has_sources(df)
+def has_sources(df):
+    """Return boolean mask for rows with non-empty source_links."""
+    return filled(df["source_links"])
 
 
 def has_typos(df):
     """Return boolean mask for rows with known typos in issues field."""
-    typo_set = set(KNOWN_TYPOS.keys())
-    return df["issues"].apply(
-        lambda x: bool(set(x) & typo_set) if isinstance(x, list) else False
+    issues = field_values(df, "issues")
+    return pd.Series(df.index.isin(issues.index[issues.isin(TYPO_SET)]), index=df.index)
+
+
+def highlight_typos(issues):
+    """Join issues for display, striking through known typos with their fix."""
+    return ", ".join(
+        f"~~{issue}~~ → {KNOWN_TYPOS[issue]}" if issue in TYPO_SET else issue
+        for issue in issues
     )
 
 
@@ -95,42 +230,111 @@ def join_list(v, sep=", "):
     return sep.join(v) if isinstance(v, list) and v else ""
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def compute_metrics(_df):
+@st.cache_resource
+def _frame_key_registry():
+    """id(df) -> (weakref, key), kept across reruns like the frames it describes."""
+    return {}
+
+
+_FRAME_KEYS = _frame_key_registry()
+
+
+def _remember_frame_key(df, key):
+    """Set the cache key frame_key() returns for this frame object."""
+    _FRAME_KEYS[id(df)] = (weakref.ref(df, lambda _, i=id(df): _FRAME_KEYS.pop(i, None)), key)
+
+
+def _content_hash(df):
+    """Order-sensitive hash of every column (lists and dicts hashed via repr)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode())
+    for name in df.columns:
+        series = df[name]
+        try:
+            hashes = pd.util.hash_pandas_object(series, index=False)
+        except (TypeError, ValueError):  # Unhashable cells (list columns)
+            hashes = pd.util.hash_pandas_object(series.map(repr), index=False)
+        digest.update(hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def frame_key(df):
+    """Cache key for a DataFrame argument.
+
+    Streamlit can't hash frames with list columns (countries, sectors, etc.) and
+    pickle-hashing a whole frame per call would cost more than most helpers.
+    Frames from load_data() are keyed on the data file signature they were
+    loaded for; any other frame on an order-sensitive hash of all its cells.
+    Frames are read-only, so each one is keyed once and later calls reuse it.
+    """
+    cached = _FRAME_KEYS.get(id(df))
+    if cached is not None and cached[0]() is df:
+        return cached[1]
+    key = (len(df), _content_hash(df))
+    _remember_frame_key(df, key)
+    return key
+
+
+# Use for any cached helper that takes a DataFrame argument
+FRAME_HASH_FUNCS = {pd.DataFrame: frame_key}
+
+
+@st.cache_resource(ttl=CACHE_TTL, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
+def field_values(df, field):
+    """Return one list field in long format: one entry per value, indexed by row.
+
+    Built once per load, so counting or searching a single field scans one flat
+    array instead of every row's Python list. Treat as read-only.
+    """
+    return df[field].explode().dropna()
+
+
+@st.cache_resource(ttl=CACHE_TTL, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
+def compute_metrics(df):
     """Pre-compute all quality metrics.
 
-    Note: _df prefix tells Streamlit to skip hashing this parameter.
-    DataFrames with list columns (countries, sectors, etc.) are unhashable.
+    Cached as a shared resource so every get_masks() call returns the same
+    mask arrays instead of unpickling a copy; callers must not modify the
+    result.
     """
-    df = _df
     total = len(df)
     if total == 0:
         return {}
 
+    # Row masks (numpy bool arrays, positional) shared by all pages via get_masks()
+    masks = {
+        "desc": has_description(df).to_numpy(),
+        "src": has_sources(df).to_numpy(),
+        "typo": has_typos(df).to_numpy(),
+        "no_date": ~filled(df["occurred"]).to_numpy(),
+        "no_url": ~filled(df["detail_page_url"]).to_numpy(),
+    }
+    masks["not_scraped"] = ~df["page_scraped"].to_numpy() & ~masks["no_url"]
+
     scraped = df["page_scraped"].sum()
-    with_desc = has_description(df).sum()
-    with_sources = has_sources(df).sum()
+    with_desc = masks["desc"].sum()
+    with_sources = masks["src"].sum()
 
-    id_counts = df["aiaaic_id"].value_counts()
-    duplicates = id_counts[id_counts > 1].index.tolist()
+    # Hash-based flag for every row of a repeated ID; only those rows get counted
+    masks["dup"] = df["aiaaic_id"].duplicated(keep=False).to_numpy()
+    duplicates = df.loc[masks["dup"], "aiaaic_id"].value_counts().index.tolist()
 
-    # Vectorized typo detection
-    typo_set = set(KNOWN_TYPOS.keys())
-    has_typo = df["issues"].apply(
-        lambda x: bool(set(x) & typo_set) if isinstance(x, list) else False
-    )
-    typo_records = df.loc[has_typo, "aiaaic_id"].tolist()
+    typo_records = df.loc[masks["typo"], "aiaaic_id"].tolist()
 
     field_completeness = {}
     for field in ["description", "source_links", "developers", "deployers",
                   "system_names", "occurred", "countries", "technologies"]:
         if field == "source_links":
-            filled = has_sources(df).sum()
+            filled_count = with_sources
         elif field == "description":
-            filled = has_description(df).sum()
+            filled_count = with_desc
         else:
-            filled = (~df[field].apply(empty)).sum()
-        field_completeness[field] = round(filled / total * 100, 1)
+            filled_count = filled(df[field]).sum()
+        field_completeness[field] = round(filled_count / total * 100, 1)
+
+    # Shared by every session and rerun, so make accidental in-place edits fail
+    for mask in masks.values():
+        mask.flags.writeable = False
 
     return {
         "total": total,
@@ -145,14 +349,150 @@ def compute_metrics(_df):
         "typo_ids": typo_records,
         "typo_count": len(typo_records),
         "field_completeness": field_completeness,
-        "no_date": (df["occurred"].apply(empty)).sum(),
+        "avg_completeness": sum(field_completeness.values()) / len(field_completeness),
+        "no_date": masks["no_date"].sum(),
+        "masks": masks,
+    }
+
+
+@st.cache_resource(ttl=CACHE_TTL, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
+def field_stats(df, field):
+    """Aggregate one list field for the Values page, once per load and field.
+
+    Slider moves and other reruns reuse the result, so only the similarity
+    filtering runs per interaction. Normalized (case-folded) forms are shared
+    by the similarity, misspelling and case-variation checks, so the scorers
+    can run with processor=None. Treat the result as read-only.
+    """
+    # explode + value_counts run in C; sort=False keeps first-seen order
+    value_counts = field_values(df, field).value_counts(sort=False)
+    counts = value_counts.to_dict()
+    freq = (value_counts.sort_values(ascending=False, kind="stable")
+            .rename_axis("Value").reset_index(name="Count"))
+    return {
+        "total": int(value_counts.sum()),
+        "counts": counts,
+        "unique": list(counts),
+        "normalized": {v: v.lower() for v in counts},
+        "singletons": [v for v, c in counts.items() if c == 1],
+        "freq": freq,
+        "freq_csv": freq.to_csv(index=False),
     }
 
 
+@st.cache_resource(ttl=CACHE_TTL)
+def similar_pairs(normalized, min_score=MIN_SIMILARITY_THRESHOLD, block_size=256):
+    """Find near-duplicate pairs among normalized unique values.
+
+    Scores once with rapidfuzz (C++, all cores) at the lowest slider threshold,
+    so moving the slider only filters the cached result. Returns (i, j, score)
+    arrays for i < j, in row-major order.
+
+    Only pairs whose lengths could reach min_score are scored: fuzz.ratio is at
+    most 200 * shorter / (shorter + longer), so values are sorted by length and
+    each block of rows is compared with the columns inside its length window.
+    """
+    lengths = np.fromiter((len(v) for v in normalized), dtype=np.int64, count=len(normalized))
+    order = np.argsort(lengths, kind="stable")
+    sorted_values = [normalized[k] for k in order]
+    sorted_lengths = lengths[order]
+    max_ratio = (200 - min_score) / min_score
+
+    found_i, found_j, found_scores = [], [], []
+    for start in range(0, len(order), block_size):
+        stop = min(start + block_size, len(order))
+        longest = int(sorted_lengths[stop - 1] * max_ratio + 1e-9)
+        end = int(np.searchsorted(sorted_lengths, longest, side="right"))
+        scores = process.cdist(sorted_values[start:stop], sorted_values[start:end], scorer=fuzz.ratio,
+                               processor=None, score_cutoff=min_score, dtype=np.float64, workers=-1)
+        rows, cols = np.nonzero((scores >= min_score) & (scores < 100))
+        cols_global = cols + start
+        keep = cols_global > rows + start  # each unordered pair once
+        a, b = order[rows[keep] + start], order[cols_global[keep]]
+        found_i.append(np.minimum(a, b))
+        found_j.append(np.maximum(a, b))
+        found_scores.append(scores[rows[keep], cols[keep]])
+
+    if not found_i:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
+    i, j, score = np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_scores)
+    by_position = np.lexsort((j, i))
+    return i[by_position], j[by_position], score[by_position]
+
+
+@st.cache_resource(ttl=CACHE_TTL)
+def correction_hints(entries, max_edits=MAX_CORRECTION_EDITS):
+    """Suggest a more frequent spelling for each singleton value.
+
+    A value used once that is within a couple of edits of a value used several
+    times is most likely a typo of it. entries is a tuple of (value, normalized,
+    count) triples; returns (value, suggestion, edits, suggestion_count) tuples.
+
+    Uses InDel distance (the metric behind fuzz.ratio): the typical typo is a
+    dropped or doubled letter, and pricing a substitution at two edits keeps
+    unrelated short names ("Ghana" / "Guyana") out of the suggestions.
+    """
+    rare = [(v, n) for v, n, c in entries if c == 1 and len(v) >= MIN_CORRECTION_LENGTH]
+    frequent = [(v, n, c) for v, n, c in entries if c > 1]
+    if not rare or not frequent:
+        return []
+
+    # Edit distances above the cutoff come back as max_edits + 1
+    distances = process.cdist([n for _, n in rare], [n for _, n, _ in frequent],
+                              scorer=Indel.distance, processor=None,
+                              score_cutoff=max_edits, dtype=np.int32, workers=-1)
+    rows, cols = np.nonzero((distances > 0) & (distances <= max_edits))
+    best = {}
+    for r, c in zip(rows.tolist(), cols.tolist()):
+        # Prefer the most used spelling, then the closest one
+        key = (-frequent[c][2], int(distances[r, c]))
+        if r not in best or key < best[r][0]:
+            best[r] = (key, c)
+    return [(rare[r][0], frequent[c][0], int(distances[r, c]), frequent[c][2])
+            for r, (_, c) in sorted(best.items())]
+
+
+@st.cache_resource(ttl=CACHE_TTL, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
+def search_index(df):
+    """Return one lowercased search string per row for the Browse page.
+
+    Headline, ID, countries and developers are joined with newlines (which a
+    search box can't contain), so a single substring scan matches within one
+    field or value, just like checking each of them separately.
+    """
+    def joined(field):
+        return df[field].map(lambda xs: "\n".join(xs) if isinstance(xs, list) else "")
+
+    blob = df["headline"] + "\n" + df["aiaaic_id"] + "\n" + joined("countries") + "\n" + joined("developers")
+    return blob.str.lower()
+
+
+@st.cache_resource(ttl=CACHE_TTL, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
+def browse_table(df):
+    """Return the Browse table columns for every row, built once per load.
+
+    Reruns only take the filtered, sorted rows from it. Treat as read-only.
+    """
+    table = df[["aiaaic_id", "headline", "occurred"]].copy()
+    table["desc"] = has_description(df).to_numpy()
+    table["sources"] = value_lengths(df["source_links"])
+    table.columns = ["ID", "Headline", "Date", "Has Desc", "Sources"]
+    return table
+
+
 def get_records_with_value(df, field, value):
     """Get all records that have a specific value in a list field."""
-    mask = df[field].apply(lambda x: value in x if isinstance(x, list) else False)
-    return df[mask]
+    values = field_values(df, field)
+    return df[df.index.isin(values.index[values == value])]
+
+
+def set_state(key, value):
+    """Button callback: update session state before the rerun it triggers.
+
+    The page then renders once with the new value, instead of rendering the
+    old state and calling st.rerun() for a second full pass.
+    """
+    st.session_state[key] = value
 
 
 def paginate_df(df, key_prefix, page_size=DEFAULT_PAGE_SIZE):
@@ -167,43 +507,183 @@ def paginate_df(df, key_prefix, page_size=DEFAULT_PAGE_SIZE):
     if page_key not in st.session_state:
         st.session_state[page_key] = 0
 
+    page = st.session_state[page_key]
     col1, col2, col3 = st.columns([1, 3, 1])
     with col1:
-        if st.button("← Prev", disabled=st.session_state[page_key] == 0, key=f"prev_{key_prefix}"):
-            st.session_state[page_key] -= 1
-            st.rerun()
+        st.button("← Prev", disabled=page == 0, key=f"prev_{key_prefix}",
+                  on_click=set_state, args=(page_key, page - 1))
     with col2:
-        st.markdown(f"**Page {st.session_state[page_key] + 1} of {total_pages}** ({total} total)")
+        st.markdown(f"**Page {page + 1} of {total_pages}** ({total} total)")
     with col3:
-        if st.button("Next →", disabled=st.session_state[page_key] >= total_pages - 1, key=f"next_{key_prefix}"):
-            st.session_state[page_key] += 1
-            st.rerun()
+        st.button("Next →", disabled=page >= total_pages - 1, key=f"next_{key_prefix}",
+                  on_click=set_state, args=(page_key, page + 1))
 
     start = st.session_state[page_key] * page_size
     end = min(start + page_size, total)
     return df.iloc[start:end], start, end
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def fetch_page_content(url: str) -> str | None:
-    """Fetch and convert page content to markdown."""
+async def _fetch_all(futures):
+    """Fetch URLs concurrently over one pooled HTTP/2 client.
+
+    futures maps each URL to a Future that gets its HTML (None unless 2xx) as
+    soon as that response arrives. A URL whose Future was cancelled before
+    its request started is skipped.
+    """
+    limits = httpx.Limits(max_connections=FETCH_CONCURRENCY * 2, max_keepalive_connections=FETCH_CONCURRENCY)
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=FETCH_TIMEOUT,
+                                 follow_redirects=True) as client:
+        async def fetch_one(url, future):
+            async with semaphore:
+                if not future.set_running_or_notify_cancel():
+                    return  # page_markdown() fetched it directly instead
+                try:
+                    resp = await client.get(url)
+                except Exception:
+                    future.set_result(None)
+                else:
+                    future.set_result(resp.text if resp.is_success else None)
+
+        await asyncio.gather(*(fetch_one(url, future) for url, future in futures.items()))
+
+
+@st.cache_resource(show_spinner=False)
+def http_client():
+    """Shared HTTP/2 client so page fetches reuse pooled connections."""
+    return httpx.Client(http2=True, follow_redirects=True, timeout=FETCH_TIMEOUT)
+
+
+@st.cache_resource(show_spinner=False)
+def page_html_store():
+    """Prefetched pages keyed by URL: a Future of the page's HTML (None on failure)."""
+    return {}
+
+
+@st.cache_resource(show_spinner=False)
+def prefetch_executor():
+    """Single worker thread for detail pages fetched ahead of navigation."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="aiaaic-prefetch")
+
+
+@st.cache_resource(show_spinner=False)
+def converted_page_urls():
+    """URLs page_markdown() has converted, so prefetching can skip them.
+
+    page_markdown() only runs its body on a cache miss, so it records each
+    URL there. Kept in a file next to the data because its disk cache
+    outlives the process. After `streamlit cache clear` or cache eviction
+    the list can name pages that are no longer cached; those are then
+    fetched directly when viewed, just without the head start.
+    """
     try:
-        resp = httpx.get(url, follow_redirects=True, timeout=10)
-        soup = BeautifulSoup(resp.text, "lxml")
-        sections = soup.find_all("section")
-        if sections:
-            html = "\n".join(str(s) for s in sections)
-        else:
-            # Fallback: get body
-            body = soup.find("body")
-            html = str(body) if body else None
-        if not html:
+        return set(PAGE_INDEX_PATH.read_text(encoding="utf-8").split())
+    except FileNotFoundError:
+        return set()
+
+
+def _remember_converted(url):
+    urls = converted_page_urls()
+    if url not in urls:
+        urls.add(url)
+        with open(PAGE_INDEX_PATH, "a", encoding="utf-8") as f:
+            f.write(url + "\n")
+
+
+def prefetch_pages(urls):
+    """Start fetching not-yet-seen detail pages in the background.
+
+    Returns immediately; the batch runs while the user reads the current
+    record, so Next/Prev usually find the page already downloaded. Pages
+    page_markdown() already has cached are skipped.
+    """
+    store = page_html_store()
+    converted = converted_page_urls()
+    pending = [u for u in dict.fromkeys(urls)
+               if isinstance(u, str) and u and u not in store and u not in converted]
+    if not pending:
+        return
+    futures = {url: Future() for url in pending}
+    prefetch_executor().submit(asyncio.run, _fetch_all(futures))
+    store.update(futures)
+    # Drop the oldest entries so pages that are never viewed don't pile up
+    for url in list(store)[:max(len(store) - PREFETCH_KEEP, 0)]:
+        del store[url]
+
+
+# Persisted so converted pages survive restarts (disk caches ignore ttl;
+# `streamlit cache clear` drops them). Raises on failure so errors are not stored.
+@st.cache_data(persist="disk", max_entries=1000, show_spinner=False)
+def page_markdown(url: str) -> str | None:
+    """Fetch a detail page and convert its sections to markdown."""
+    future = page_html_store().pop(url, None)
+    # A prefetch already in flight is the quickest source; one still queued
+    # behind another batch is cancelled and the page fetched directly
+    html = future.result() if future is not None and not future.cancel() else None
+    if html is None:
+        resp = http_client().get(url)
+        resp.raise_for_status()  # Don't parse (or cache) error pages
+        html = resp.text
+    # Only build tree nodes for <section> content; navigation, scripts and
+    # footers are skipped by the parser instead of becoming Tag objects
+    sections = BeautifulSoup(html, "lxml", parse_only=SECTION_STRAINER).find_all("section")
+    if not sections:
+        # Fallback: get body
+        soup = BeautifulSoup(html, "lxml")
+        body = soup.find("body")
+        if not body:
+            _remember_converted(url)
             return None
-        return md(html, heading_style="ATX", strip=["script", "style"])
+        sections = [body]
+    # Move the nodes into a fresh document and convert it without re-parsing
+    # (sections that contain nested sections are copied so those stay in place)
+    doc = BeautifulSoup("", "html.parser")
+    for i, section in enumerate(sections):
+        if i:
+            doc.append(NavigableString("\n"))
+        doc.append(copy.copy(section) if section.find("section") else section.extract())
+    markdown = MARKDOWN_CONVERTER.convert_soup(doc)
+    _remember_converted(url)
+    return markdown
+
+
+def fetch_page_content(url: str) -> str | None:
+    """Fetch and convert page content to markdown (None on failure)."""
+    try:
+        return page_markdown(url)
     except Exception:
         return None
 
 
+def inspect_positions(df, filter_opt, desc_len, len_range=None):
+    """Return row positions of df matching an Inspect filter, in display order.
+
+    Only the current record is materialized from these, so switching filters
+    or stepping through records never copies the filtered frame.
+    """
+    masks = get_masks()
+    if filter_opt == "missing description":
+        return np.flatnonzero(~masks["desc"])
+    if filter_opt == "missing sources":
+        return np.flatnonzero(~masks["src"])
+    if filter_opt == "missing date":
+        return np.flatnonzero(masks["no_date"])
+    if filter_opt == "no URL":
+        return np.flatnonzero(masks["no_url"])
+    if filter_opt == "not scraped":
+        return np.flatnonzero(masks["not_scraped"])
+    if filter_opt == "has typos":
+        return np.flatnonzero(masks["typo"])
+    if filter_opt == "complete":
+        return np.flatnonzero(masks["desc"] & masks["src"])
+    if filter_opt == "description length":
+        positions = np.flatnonzero((desc_len >= len_range[0]) & (desc_len <= len_range[1]))
+        # Sort by description length ascending
+        return positions[np.argsort(desc_len[positions], kind="stable")]
+    return np.arange(len(df))  # all
+
+
 # === PAGE FUNCTIONS ===
 
 def page_dashboard():
@@ -321,7 +801,7 @@ def page_dashboard():
 def page_browse():
     """Browse - searchable table with pagination."""
     df = get_data()
-    metrics = get_metrics()
+    masks = get_masks()
 
     st.header("Browse Incidents")
 
@@ -332,33 +812,24 @@ def page_browse():
     with col2:
         status = st.selectbox("Filter", ["all", "complete", "incomplete", "duplicates"])
 
-    # Apply search
-    view = df.copy()
+    # Build one row mask over the full frame (the shared df is never mutated)
+    keep = np.ones(len(df), dtype=bool)
     if search:
-        search_lower = search.lower()
-        mask = (
-            view["headline"].str.lower().str.contains(search_lower, na=False) |
-            view["aiaaic_id"].str.lower().str.contains(search_lower, na=False) |
-            view["countries"].apply(lambda x: any(search_lower in c.lower() for c in x) if isinstance(x, list) else False) |
-            view["developers"].apply(lambda x: any(search_lower in d.lower() for d in x) if isinstance(x, list) else False)
-        )
-        view = view[mask]
+        keep &= search_index(df).str.contains(search.lower(), regex=False, na=False).to_numpy()
 
     # Apply filter
     if status == "complete":
-        view = view[is_complete(view)]
+        keep &= masks["desc"] & masks["src"]
     elif status == "incomplete":
-        view = view[is_incomplete(view)]
+        keep &= ~masks["desc"] | ~masks["src"]
     elif status == "duplicates":
-        view = view[view["aiaaic_id"].isin(metrics["duplicates"])]
+        keep &= masks["dup"]
 
-    view = view.sort_values("occurred", ascending=False).reset_index(drop=True)
+    # Sort row positions by date; only the displayed columns are ever copied
+    rows = df["occurred"][keep].sort_values(ascending=False).index.to_numpy()
 
     # Display table
-    display_df = view[["aiaaic_id", "headline", "occurred"]].copy()
-    display_df["desc"] = has_description(view)
-    display_df["sources"] = view["source_links"].apply(lambda x: len(x) if isinstance(x, list) else 0)
-    display_df.columns = ["ID", "Headline", "Date", "Has Desc", "Sources"]
+    display_df = browse_table(df).take(rows).reset_index(drop=True)
 
     paged_df, start, _ = paginate_df(display_df, "browse", page_size=DEFAULT_PAGE_SIZE)
 
@@ -374,7 +845,7 @@ def page_browse():
     # Detail panel
     if event and event.selection and event.selection.rows:
         selected_idx = start + event.selection.rows[0]
-        row = view.iloc[selected_idx]
+        row = df.iloc[rows[selected_idx]]
 
         st.divider()
         st.subheader(row["headline"])
@@ -424,37 +895,35 @@ def page_values():
     col1, col2 = st.columns([1, 3])
     with col1:
         field = st.selectbox("Field", LIST_FIELDS, index=LIST_FIELDS.index("issues"))
-        thresh = st.slider("Similarity", 70, 99, DEFAULT_SIMILARITY_THRESHOLD)
-
-    # Gather values
-    values = []
-    for v in df[field].dropna():
-        if isinstance(v, list):
-            values.extend(v)
+        thresh = st.slider("Similarity", MIN_SIMILARITY_THRESHOLD, 99, DEFAULT_SIMILARITY_THRESHOLD)
 
-    if not values:
+    stats = field_stats(df, field)
+    if not stats["counts"]:
         st.warning("No values found")
         return
 
-    unique = list(set(values))
-    counts = Counter(values)
-    singletons = [v for v, c in counts.items() if c == 1]
+    total_uses = stats["total"]
+    counts = stats["counts"]
+    unique = stats["unique"]
+    normalized = stats["normalized"]
+    singletons = stats["singletons"]
 
     # Metrics
     with col2:
         m1, m2, m3, m4 = st.columns(4)
-        m1.metric("Total uses", len(values))
+        m1.metric("Total uses", total_uses)
         m2.metric("Unique values", len(unique))
-        m3.metric("Avg per incident", f"{len(values)/len(df):.1f}")
+        m3.metric("Avg per incident", f"{total_uses/len(df):.1f}")
         m4.metric("Singletons", len(singletons))
 
     # Show known typos if in issues field
-    if field == "issues" and any(t in unique for t in KNOWN_TYPOS):
+    known_typos = field == "issues" and not TYPO_SET.isdisjoint(counts)
+    if known_typos:
         st.error("**Known Typos Detected:**")
         typo_cols = st.columns(3)
         col_idx = 0
         for typo, correction in KNOWN_TYPOS.items():
-            if typo in unique:
+            if typo in counts:
                 with typo_cols[col_idx % 3]:
                     st.code(f"{typo} → {correction}")
                     affected = get_records_with_value(df, field, typo)
@@ -466,21 +935,19 @@ def page_values():
 
     with left:
         st.subheader("Value Frequency")
-        freq = pd.DataFrame(counts.most_common(), columns=["Value", "Count"])
-        csv = freq.to_csv(index=False)
-        st.download_button("Export CSV", csv, f"{field}_frequency.csv", "text/csv")
+        freq = stats["freq"]
+        st.download_button("Export CSV", stats["freq_csv"], f"{field}_frequency.csv", "text/csv")
         st.dataframe(freq, hide_index=True, height=350, width="stretch")
 
     with right:
         st.subheader("Potential Issues")
 
-        # Similar values
-        similar = []
-        for i, v1 in enumerate(unique):
-            for v2 in unique[i+1:]:
-                score = fuzz.ratio(v1.lower(), v2.lower())
-                if thresh <= score < 100:
-                    similar.append((v1, v2, score, counts[v1], counts[v2]))
+        # Similar values. Known typos are already reported above, so skip them.
+        candidates = [v for v in unique if v not in TYPO_SET] if known_typos else unique
+        rows, cols, scores = similar_pairs(tuple(normalized[v] for v in candidates))
+        keep = scores >= thresh
+        similar = [(candidates[i], candidates[j], score, counts[candidates[i]], counts[candidates[j]])
+                   for i, j, score in zip(rows[keep].tolist(), cols[keep].tolist(), scores[keep].tolist())]
         similar.sort(key=lambda x: -x[2])
 
         if similar:
@@ -490,10 +957,17 @@ def page_values():
         else:
             st.success("No similar values found")
 
+        # Rare values that look like misspellings of a frequent one
+        hints = correction_hints(tuple((v, normalized[v], c) for v, c in counts.items() if v not in TYPO_SET))
+        if hints:
+            st.markdown(f"**Likely misspellings ({len(hints)})**")
+            hint_df = pd.DataFrame(hints[:20], columns=["Value", "Suggested", "Edits", "Uses"])
+            st.dataframe(hint_df, hide_index=True, height=200)
+
         # Case variations
         lower_map = {}
         for v in unique:
-            lower_map.setdefault(v.lower(), []).append(v)
+            lower_map.setdefault(normalized[v], []).append(v)
         case_vars = [(k, vs) for k, vs in lower_map.items() if len(vs) > 1]
 
         if case_vars:
@@ -539,13 +1013,7 @@ def show_record_detail(row):
         # Highlight typos in issues
         issues = row.get("issues", [])
         if issues:
-            display_issues = []
-            for issue in issues:
-                if issue in KNOWN_TYPOS:
-                    display_issues.append(f"~~{issue}~~ → {KNOWN_TYPOS[issue]}")
-                else:
-                    display_issues.append(issue)
-            st.markdown(f"⚠️ {', '.join(display_issues)}")
+            st.markdown(f"⚠️ {highlight_typos(issues)}")
 
         st.markdown("**Source Links:**")
         sources = row.get("source_links", [])
@@ -559,9 +1027,9 @@ def show_record_detail(row):
             st.warning("No source links")
 
 
-def show_gap_table(data_df, key_prefix):
-    """Show a gap table with clickable rows and detail panel."""
-    display = data_df[["aiaaic_id", "headline", "occurred"]].reset_index(drop=True)
+def show_gap_table(df, rows, key_prefix):
+    """Show a gap table (positional `rows` of df) with clickable rows and detail panel."""
+    display = df[["aiaaic_id", "headline", "occurred"]].take(rows).reset_index(drop=True)
     display.columns = ["ID", "Headline", "Date"]
 
     event = st.dataframe(
@@ -576,7 +1044,7 @@ def show_gap_table(data_df, key_prefix):
 
     if event and event.selection and event.selection.rows:
         selected_idx = event.selection.rows[0]
-        row = data_df.iloc[selected_idx]
+        row = df.iloc[rows[selected_idx]]
         show_record_detail(row)
 
 
@@ -587,13 +1055,14 @@ def page_gaps():
 
     st.header("Data Gaps")
 
-    # Compute gap categories
-    no_url = df[df["detail_page_url"].apply(empty)].reset_index(drop=True)
-    no_desc = df[(df["page_scraped"]) & (~has_description(df))].reset_index(drop=True)
-    no_src = df[~has_sources(df)].reset_index(drop=True)
-    no_date = df[df["occurred"].apply(empty)].reset_index(drop=True)
-    not_scraped = df[~df["page_scraped"] & ~df["detail_page_url"].apply(empty)].reset_index(drop=True)
-    with_typos = df[has_typos(df)].reset_index(drop=True)
+    # Gap categories as row positions; tables only copy the columns they show
+    masks = get_masks()
+    no_url = np.flatnonzero(masks["no_url"])
+    no_desc = np.flatnonzero(df["page_scraped"].to_numpy() & ~masks["desc"])
+    no_src = np.flatnonzero(~masks["src"])
+    no_date = np.flatnonzero(masks["no_date"])
+    not_scraped = np.flatnonzero(masks["not_scraped"])
+    with_typos = np.flatnonzero(masks["typo"])
 
     # Summary metrics
     c1, c2, c3, c4, c5, c6 = st.columns(6)
@@ -610,32 +1079,32 @@ def page_gaps():
     tabs = st.tabs(["No description", "No sources", "No date", "Has typos", "Errors", "No URL", "Not scraped"])
 
     with tabs[0]:
-        if no_desc.empty:
+        if not no_desc.size:
             st.success("All scraped incidents have descriptions")
         else:
             st.caption(f"{len(no_desc)} records - click to view details")
-            show_gap_table(no_desc, "desc")
+            show_gap_table(df, no_desc, "desc")
 
     with tabs[1]:
-        if no_src.empty:
+        if not no_src.size:
             st.success("All incidents have source links")
         else:
             st.caption(f"{len(no_src)} records - click to view details")
-            show_gap_table(no_src, "src")
+            show_gap_table(df, no_src, "src")
 
     with tabs[2]:
-        if no_date.empty:
+        if not no_date.size:
             st.success("All incidents have dates")
         else:
             st.caption(f"{len(no_date)} records - click to view details")
-            show_gap_table(no_date, "date")
+            show_gap_table(df, no_date, "date")
 
     with tabs[3]:
-        if with_typos.empty:
+        if not with_typos.size:
             st.success("No known typos detected")
         else:
             st.caption(f"{len(with_typos)} records - click to view details")
-            show_gap_table(with_typos, "typos")
+            show_gap_table(df, with_typos, "typos")
 
     with tabs[4]:
         if not errors:
@@ -653,18 +1122,18 @@ def page_gaps():
                         st.code(e.get("error_message", "No message")[:200])
 
     with tabs[5]:
-        if no_url.empty:
+        if not no_url.size:
             st.success("All incidents have URLs")
         else:
             st.caption(f"{len(no_url)} records - click to view details")
-            show_gap_table(no_url, "url")
+            show_gap_table(df, no_url, "url")
 
     with tabs[6]:
-        if not_scraped.empty:
+        if not not_scraped.size:
             st.success("All incidents with URLs have been scraped")
         else:
             st.caption(f"{len(not_scraped)} records - click to view details")
-            show_gap_table(not_scraped, "not_scraped")
+            show_gap_table(df, not_scraped, "not_scraped")
 
 
 def page_inspect():
@@ -687,8 +1156,8 @@ def page_inspect():
     }
 
     # Compute description lengths upfront
-    desc_len = df["description"].apply(lambda x: len(x) if isinstance(x, str) else 0)
-    max_desc_len = int(desc_len.max()) if desc_len.max() > 0 else 1000
+    desc_len = value_lengths(df["description"])
+    max_desc_len = int(desc_len.max()) if desc_len.size and desc_len.max() > 0 else 1000
 
     # Filter controls
     col1, col2, col3 = st.columns([2, 2, 1])
@@ -712,49 +1181,26 @@ def page_inspect():
             id_input = st.text_input("Jump to ID", placeholder="e.g. AIAAIC0001", label_visibility="visible")
 
     # Apply filter
-    if filter_opt == "missing description":
-        filtered = df[~has_description(df)]
-    elif filter_opt == "missing sources":
-        filtered = df[~has_sources(df)]
-    elif filter_opt == "missing date":
-        filtered = df[df["occurred"].apply(empty)]
-    elif filter_opt == "no URL":
-        filtered = df[df["detail_page_url"].apply(empty)]
-    elif filter_opt == "not scraped":
-        filtered = df[~df["page_scraped"] & ~df["detail_page_url"].apply(empty)]
-    elif filter_opt == "has typos":
-        filtered = df[has_typos(df)]
-    elif filter_opt == "complete":
-        filtered = df[is_complete(df)]
-    elif filter_opt == "description length":
-        filtered = df[(desc_len >= len_range[0]) & (desc_len <= len_range[1])]
-        # Sort by description length ascending
-        filtered = filtered.assign(_desc_len=desc_len[filtered.index])
-        filtered = filtered.sort_values("_desc_len", ascending=True).drop(columns=["_desc_len"])
-    else:  # all
-        filtered = df
-
-    filtered = filtered.reset_index(drop=True)
+    positions = inspect_positions(df, filter_opt, desc_len,
+                                  len_range if filter_opt == "description length" else None)
 
     with col3:
-        st.metric("Matching", len(filtered))
+        st.metric("Matching", positions.size)
 
     # Handle ID lookup (only when not in description length mode)
     if filter_opt != "description length" and id_input:
         id_upper = id_input.strip().upper()
+        all_matches = np.flatnonzero(df["aiaaic_id"].str.upper().to_numpy() == id_upper)
         # Check if ID exists in filtered data
-        matches = filtered[filtered["aiaaic_id"].str.upper() == id_upper]
-        if not matches.empty:
-            st.session_state.inspect_idx = matches.index[0]
+        matches = np.flatnonzero(np.isin(positions, all_matches))
+        if matches.size:
+            st.session_state.inspect_idx = int(matches[0])
+        elif all_matches.size:  # Exists in full data
+            st.warning(f"ID '{id_upper}' exists but doesn't match current filter. Switch to 'All records' to view it.")
         else:
-            # Check if ID exists in full data
-            all_matches = df[df["aiaaic_id"].str.upper() == id_upper]
-            if not all_matches.empty:
-                st.warning(f"ID '{id_upper}' exists but doesn't match current filter. Switch to 'All records' to view it.")
-            else:
-                st.error(f"ID '{id_upper}' not found")
+            st.error(f"ID '{id_upper}' not found")
 
-    if filtered.empty:
+    if not positions.size:
         st.success("No records match this filter")
         return
 
@@ -763,32 +1209,29 @@ def page_inspect():
     # Navigation
     if "inspect_idx" not in st.session_state:
         st.session_state.inspect_idx = 0
-    if st.session_state.inspect_idx >= len(filtered):
+    if st.session_state.inspect_idx >= positions.size:
         st.session_state.inspect_idx = 0
 
+    idx = st.session_state.inspect_idx
     nav1, nav2, nav5, nav4, nav3 = st.columns([1, 1, 1, 2, 2])
     with nav1:
-        if st.button("⏮ First", width='stretch'):
-            st.session_state.inspect_idx = 0
-            st.rerun()
+        st.button("⏮ First", width='stretch', on_click=set_state, args=("inspect_idx", 0))
     with nav2:
-        if st.button("◀ Prev", width='stretch', disabled=st.session_state.inspect_idx == 0):
-            st.session_state.inspect_idx -= 1
-            st.rerun()
+        st.button("◀ Prev", width='stretch', disabled=idx == 0,
+                  on_click=set_state, args=("inspect_idx", idx - 1))
     with nav3:
-        st.markdown(f"#### {st.session_state.inspect_idx + 1} / {len(filtered)}")
+        st.markdown(f"#### {st.session_state.inspect_idx + 1} / {positions.size}")
     with nav4:
-        jump = st.number_input("Go to", 1, len(filtered), st.session_state.inspect_idx + 1, label_visibility="collapsed")
+        jump = st.number_input("Go to", 1, positions.size, st.session_state.inspect_idx + 1, label_visibility="collapsed")
         if jump - 1 != st.session_state.inspect_idx:
             st.session_state.inspect_idx = jump - 1
             st.rerun()
     with nav5:
-        if st.button("Next ▶", width='stretch', disabled=st.session_state.inspect_idx >= len(filtered) - 1):
-            st.session_state.inspect_idx += 1
-            st.rerun()
+        st.button("Next ▶", width='stretch', disabled=idx >= positions.size - 1,
+                  on_click=set_state, args=("inspect_idx", idx + 1))
 
     # Get current record
-    row = filtered.iloc[st.session_state.inspect_idx]
+    row = df.iloc[positions[st.session_state.inspect_idx]]
 
     # Header
     st.divider()
@@ -847,13 +1290,7 @@ def page_inspect():
         # Special handling for issues field - highlight typos
         issues = row.get("issues", [])
         if issues:
-            display_issues = []
-            for issue in issues:
-                if issue in KNOWN_TYPOS:
-                    display_issues.append(f"~~{issue}~~ → {KNOWN_TYPOS[issue]}")
-                else:
-                    display_issues.append(issue)
-            st.markdown(f"⚠️ **issues:** {', '.join(display_issues)}")
+            st.markdown(f"⚠️ **issues:** {highlight_typos(issues)}")
 
     with right:
         st.markdown("### Original Page")
@@ -864,6 +1301,10 @@ def page_inspect():
             with st.spinner("Loading page content..."):
                 content = fetch_page_content(url)
 
+            # Download the next few records while this one is being read
+            idx = st.session_state.inspect_idx
+            prefetch_pages(df["detail_page_url"].take(positions[idx + 1:idx + 1 + PREFETCH_AHEAD]).tolist())
+
             if content:
                 with st.container(height=500):
                     st.markdown(content)
@@ -886,8 +1327,12 @@ def page_consistency():
 
     st.divider()
 
-    # Run consistency check
-    report = check_consistency(DATA_PATH)
+    # Consistency check runs in the background (see consistency_future)
+    future = consistency_future(data_signature())
+    if not future.done():
+        with st.spinner("Checking data consistency..."):
+            future.result()
+    report = future.result()
 
     # Summary metrics
     c1, c2, c3, c4 = st.columns(4)
@@ -977,13 +1422,13 @@ def page_consistency():
 
 
 def get_data():
-    """Get incident data (cached)."""
-    return load_data()
+    """Get incident data (cached until the data file changes)."""
+    return load_data(data_signature())
 
 
 def get_errors():
-    """Get scraping errors (cached)."""
-    return load_errs()
+    """Get scraping errors (cached until the errors file changes)."""
+    return load_errs(file_signature(ERRORS_PATH))
 
 
 def get_metrics():
@@ -992,6 +1437,11 @@ def get_metrics():
     return compute_metrics(df) if not df.empty else {}
 
 
+def get_masks():
+    """Get cached row masks (positional bool arrays aligned with get_data())."""
+    return get_metrics().get("masks", {})
+
+
 # === MAIN APP ===
 
 # Check for data availability
@@ -1001,6 +1451,7 @@ if df.empty:
     st.stop()
 
 metrics = get_metrics()
+consistency_future(data_signature())  # Kick off the check before anyone opens the page
 
 # Define pages
 dashboard = st.Page(page_dashboard, title="Dashboard", icon="📊", default=True)
@@ -1021,9 +1472,8 @@ pg = st.navigation({
 with st.sidebar:
     st.divider()
     st.caption("Quality Score")
-    avg_completeness = sum(metrics["field_completeness"].values()) / len(metrics["field_completeness"])
-    st.progress(avg_completeness / 100)
-    st.markdown(f"**{avg_completeness:.0f}%** complete")
+    st.progress(metrics["avg_completeness"] / 100)
+    st.markdown(f"**{metrics['avg_completeness']:.0f}%** complete")
     st.caption(f"{metrics['total']} incidents")
 
 # Run the selected page
@@ -18,6 +18,7 @@ Usage:
     uv run scrape.py --deduplicate      # Remove duplicates, keep best version
     uv run scrape.py --concurrency 20   # Set concurrent requests (default: 20)
     uv run scrape.py --verbose          # Show detailed extraction info
+    uv run scrape.py --no-cache         # Re-download the CSV without revalidating the cached copy
 """
 
 import argparse
@@ -122,6 +123,11 @@ def main() -> int:
         default=DEFAULT_OUTPUT_FILE,
         help=f"Output file path (default: {DEFAULT_OUTPUT_FILE})",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-download the incident CSV instead of revalidating the cached copy",
+    )
     parser.add_argument(
         "--min-desc-length",
         type=int,
@@ -136,7 +142,7 @@ def main() -> int:
         from src.csv_parser import fetch_incidents
 
         con.console.print("[bold]Fetching CSV from Google Sheets...[/bold]")
-        incidents = fetch_incidents()
+        incidents = fetch_incidents(use_cache=not args.no_cache)
         no_url_incidents = [i for i in incidents if not i.detail_page_url]
 
         from rich.table import Table
@@ -150,7 +156,7 @@ def main() -> int:
             table.add_row(
                 incident.aiaaic_id,
                 incident.occurred or "-",
-                incident.headline[:80] + "..." if len(incident.headline) > 80 else incident.headline,
+                con.truncate(incident.headline, 80),
             )
 
         con.console.print(table)
@@ -159,7 +165,7 @@ def main() -> int:
 
     # Handle --single mode: scrape and display a single incident
     if args.single:
-        from src.csv_parser import fetch_incidents
+        from src.csv_parser import find_incident
         from src.page_scraper import scrape_page_sync
         from rich.panel import Panel
         from rich.text import Text
@@ -170,8 +176,7 @@ def main() -> int:
             aiaaic_id = f"AIAAIC{aiaaic_id}"
 
         con.console.print(f"[bold]Fetching CSV to find {aiaaic_id}...[/bold]")
-        incidents = fetch_incidents()
-        incident = next((i for i in incidents if i.aiaaic_id == aiaaic_id), None)
+        incident = find_incident(aiaaic_id, use_cache=not args.no_cache)
 
         if not incident:
             con.print_error(f"Incident {aiaaic_id} not found in CSV")
@@ -190,56 +195,57 @@ def main() -> int:
             except httpx.HTTPError as e:
                 con.print_warning(f"Failed to scrape page: {e}")
 
-        # Display the incident nicely
-        con.console.print()
-        con.console.print(Panel(
-            f"[bold cyan]{incident.aiaaic_id}[/bold cyan]",
-            title="AIAAIC Incident",
-            subtitle=incident.occurred or "Unknown date",
-        ))
-        con.console.print(f"\n[bold]{incident.headline}[/bold]\n")
-
-        if incident.description:
-            con.console.print(Panel(incident.description, title="Description", border_style="dim"))
-
-        # Metadata table
-        from rich.table import Table
-        meta = Table(show_header=False, box=None, padding=(0, 2))
-        meta.add_column("Field", style="dim")
-        meta.add_column("Value")
-
-        if incident.countries:
-            meta.add_row("Countries", ", ".join(incident.countries))
-        if incident.sectors:
-            meta.add_row("Sectors", ", ".join(incident.sectors))
-        if incident.deployers:
-            meta.add_row("Deployers", ", ".join(incident.deployers))
-        if incident.developers:
-            meta.add_row("Developers", ", ".join(incident.developers))
-        if incident.system_names:
-            meta.add_row("Systems", ", ".join(incident.system_names))
-        if incident.technologies:
-            meta.add_row("Technologies", ", ".join(incident.technologies))
-        if incident.issues:
-            meta.add_row("Issues", ", ".join(incident.issues))
-
-        con.console.print(meta)
-
-        # Source links
-        if incident.source_links:
-            con.console.print(f"\n[bold]Source Links ({len(incident.source_links)}):[/bold]")
-            for link in incident.source_links:
-                title = link.title or link.url
-                con.console.print(f"  [link={link.url}]{title}[/link]")
-
-        # Related incidents
-        if incident.related_incidents:
-            con.console.print(f"\n[bold]Related Incidents ({len(incident.related_incidents)}):[/bold]")
-            for rel in incident.related_incidents:
-                con.console.print(f"  [link={rel.url}]{rel.title}[/link]")
-
-        if incident.detail_page_url:
-            con.console.print(f"\n[dim]Detail page: {incident.detail_page_url}[/dim]")
+        # Display the incident nicely (buffered, written to the terminal once)
+        with con.console:
+            con.console.print()
+            con.console.print(Panel(
+                f"[bold cyan]{incident.aiaaic_id}[/bold cyan]",
+                title="AIAAIC Incident",
+                subtitle=incident.occurred or "Unknown date",
+            ))
+            con.console.print(f"\n[bold]{incident.headline}[/bold]\n")
+
+            if incident.description:
+                con.console.print(Panel(incident.description, title="Description", border_style="dim"))
+
+            # Metadata table
+            from rich.table import Table
+            meta = Table(show_header=False, box=None, padding=(0, 2))
+            meta.add_column("Field", style="dim")
+            meta.add_column("Value")
+
+            if incident.countries:
+                meta.add_row("Countries", ", ".join(incident.countries))
+            if incident.sectors:
+                meta.add_row("Sectors", ", ".join(incident.sectors))
+            if incident.deployers:
+                meta.add_row("Deployers", ", ".join(incident.deployers))
+            if incident.developers:
+                meta.add_row("Developers", ", ".join(incident.developers))
+            if incident.system_names:
+                meta.add_row("Systems", ", ".join(incident.system_names))
+            if incident.technologies:
+                meta.add_row("Technologies", ", ".join(incident.technologies))
+            if incident.issues:
+                meta.add_row("Issues", ", ".join(incident.issues))
+
+            con.console.print(meta)
+
+            # Source links
+            if incident.source_links:
+                con.console.print(f"\n[bold]Source Links ({len(incident.source_links)}):[/bold]")
+                for link in incident.source_links:
+                    title = link.title or link.url
+                    con.console.print(f"  [link={link.url}]{title}[/link]")
+
+            # Related incidents
+            if incident.related_incidents:
+                con.console.print(f"\n[bold]Related Incidents ({len(incident.related_incidents)}):[/bold]")
+                for rel in incident.related_incidents:
+                    con.console.print(f"  [link={rel.url}]{rel.title}[/link]")
+
+            if incident.detail_page_url:
+                con.console.print(f"\n[dim]Detail page: {incident.detail_page_url}[/dim]")
 
         return 0
 
@@ -252,6 +258,13 @@ def main() -> int:
             con.console.print("[green]No errors found![/green]")
             return 0
 
+        if not con.console.is_terminal:
+            # Piped output: one tab-separated line per error, no table layout
+            for error in errors:
+                message = " ".join(error.error_message.split())
+                print(f"{error.aiaaic_id}\t{error.error_type}\t{message}\t{error.timestamp:%Y-%m-%d %H:%M}")
+            return 0
+
         from rich.table import Table
 
         table = Table(title=f"Scraping Errors ({len(errors)} total)")
@@ -264,17 +277,18 @@ def main() -> int:
             table.add_row(
                 error.aiaaic_id,
                 error.error_type,
-                error.error_message[:60] + "..." if len(error.error_message) > 60 else error.error_message,
+                con.truncate(error.error_message, 60),
                 error.timestamp.strftime("%Y-%m-%d %H:%M"),
             )
 
-        con.console.print(table)
-        con.console.print(f"\n[dim]Use --retry-errors to retry these incidents[/dim]")
+        with con.console:  # Table and hint in one terminal write
+            con.console.print(table)
+            con.console.print(f"\n[dim]Use --retry-errors to retry these incidents[/dim]")
         return 0
 
     # Handle --incomplete mode: find incidents with missing page data
     if args.incomplete:
-        from src.utils import load_incidents
+        from src.utils import find_incomplete
 
         output_path = args.output
         if not output_path.exists():
@@ -282,25 +296,18 @@ def main() -> int:
             con.console.print("[dim]Run the scraper first to generate data[/dim]")
             return 1
 
-        incidents = list(load_incidents(output_path))
-        incomplete = []
-
-        for inc in incidents:
-            if not inc.page_scraped:
-                continue  # Skip unscraped incidents
-            missing = []
-            if not inc.description:
-                missing.append("description")
-            if not inc.source_links:
-                missing.append("sources")
-            # Note: related_incidents can legitimately be empty, so not checked
-            if missing:
-                incomplete.append((inc, missing))
+        scraped_count, incomplete = find_incomplete(output_path)
 
         if not incomplete:
             con.console.print("[green]All scraped incidents have complete page data![/green]")
             return 0
 
+        if not con.console.is_terminal:
+            # Piped output: one tab-separated line per incident, no table layout
+            for inc in incomplete:
+                print(f"{inc.aiaaic_id}\t{' '.join(inc.headline.split())}\t{','.join(inc.missing)}")
+            return 0
+
         from rich.table import Table
 
         table = Table(title=f"Incomplete Incidents ({len(incomplete)} total)")
@@ -308,21 +315,21 @@ def main() -> int:
         table.add_column("Headline", style="white", max_width=50)
         table.add_column("Missing", style="yellow")
 
-        for inc, missing in incomplete:
+        for inc in incomplete:
             table.add_row(
                 inc.aiaaic_id,
-                inc.headline[:50] + "..." if len(inc.headline) > 50 else inc.headline,
-                ", ".join(missing),
+                con.truncate(inc.headline, 50),
+                ", ".join(inc.missing),
             )
 
-        con.console.print(table)
-        scraped_count = sum(1 for i in incidents if i.page_scraped)
-        con.console.print(f"\n[dim]Scraped: {scraped_count} | Incomplete: {len(incomplete)} | Complete: {scraped_count - len(incomplete)}[/dim]")
+        with con.console:  # Table and summary in one terminal write
+            con.console.print(table)
+            con.console.print(f"\n[dim]Scraped: {scraped_count} | Incomplete: {len(incomplete)} | Complete: {scraped_count - len(incomplete)}[/dim]")
         return 0
 
     # Handle --rescrape-incomplete mode: find and rescrape incomplete incidents
     if args.rescrape_incomplete:
-        from src.utils import load_incidents
+        from src.utils import find_incomplete
 
         output_path = args.output
         if not output_path.exists():
@@ -330,21 +337,11 @@ def main() -> int:
             con.console.print("[dim]Run the scraper first to generate data[/dim]")
             return 1
 
-        # Find incomplete incident IDs
-        incidents = list(load_incidents(output_path))
-        incomplete_ids: set[str] = set()
-        short_desc_ids: set[str] = set()
+        # Find incomplete incident IDs (short descriptions only if --min-desc-length given)
         min_len = args.min_desc_length
-
-        for inc in incidents:
-            if not inc.page_scraped:
-                continue
-            # Standard incomplete: missing description or sources
-            if not inc.description or not inc.source_links:
-                incomplete_ids.add(inc.aiaaic_id)
-            # Short description check (if --min-desc-length specified)
-            elif min_len and inc.description and len(inc.description) < min_len:
-                short_desc_ids.add(inc.aiaaic_id)
+        _, records = find_incomplete(output_path, min_desc_length=min_len)
+        incomplete_ids = {r.aiaaic_id for r in records if r.missing != ["short description"]}
+        short_desc_ids = {r.aiaaic_id for r in records if r.missing == ["short description"]}
 
         # Combine both sets
         target_ids = incomplete_ids | short_desc_ids
@@ -374,6 +371,7 @@ def main() -> int:
                     target_ids=target_ids,
                     concurrency=args.concurrency,
                     verbose=args.verbose,
+                    use_cache=not args.no_cache,
                 )
             )
             return 1 if stats.failed > 0 else 0
@@ -531,6 +529,7 @@ def main() -> int:
                 sample=args.sample,
                 concurrency=args.concurrency,
                 verbose=args.verbose,
+                use_cache=not args.no_cache,
             )
         )
 
@@ -51,6 +51,11 @@ class ScrapeStats:
         return 0.0
 
 
+def truncate(text: str, width: int) -> str:
+    """Shorten text to width characters, marking cut text with "..."."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
 def create_progress() -> Progress:
     """Create a Rich progress bar for scraping."""
     return Progress(
@@ -119,8 +124,7 @@ def print_incident_status(
         "skip": "dim",
     }.get(status, "white")
 
-    headline_short = headline[:50] + "..." if len(headline) > 50 else headline
-    msg = f"[{status_style}]{aiaaic_id}[/{status_style}] {headline_short}"
+    msg = f"[{status_style}]{aiaaic_id}[/{status_style}] {truncate(headline, 50)}"
     if details:
         msg += f" [dim]({details})[/dim]"
     console.print(msg)
@@ -130,6 +134,9 @@ def print_summary(stats: ScrapeStats) -> None:
     """Print the final summary table."""
     console.print()
 
+    def pct(count: int, total: int) -> str:
+        return f"{count / max(total, 1) * 100:.1f}%"
+
     # Main stats table
     table = Table(title="[bold]Scraping Summary[/bold]", show_header=True)
     table.add_column("Metric", style="cyan")
@@ -140,12 +147,12 @@ def print_summary(stats: ScrapeStats) -> None:
     table.add_row(
         "Successful",
         str(stats.successful),
-        f"[green]({stats.successful/max(stats.processed,1)*100:.1f}%)[/green]",
+        f"[green]({pct(stats.successful, stats.processed)})[/green]",
     )
     table.add_row(
         "Failed",
         str(stats.failed),
-        f"[red]({stats.failed/max(stats.processed,1)*100:.1f}%)[/red]" if stats.failed else "",
+        f"[red]({pct(stats.failed, stats.processed)})[/red]" if stats.failed else "",
     )
     table.add_row("Skipped (already done)", str(stats.skipped), "")
     table.add_row("No detail page URL", str(stats.no_url), "")
@@ -163,17 +170,17 @@ def print_summary(stats: ScrapeStats) -> None:
         field_table.add_row(
             "Descriptions",
             str(stats.descriptions_found),
-            f"{stats.descriptions_found/stats.successful*100:.1f}%",
+            pct(stats.descriptions_found, stats.successful),
         )
         field_table.add_row(
             "Source Links",
             str(stats.source_links_found),
-            f"{stats.source_links_found/stats.successful*100:.1f}%",
+            pct(stats.source_links_found, stats.successful),
         )
         field_table.add_row(
             "Related Incidents",
             str(stats.related_found),
-            f"{stats.related_found/stats.successful*100:.1f}%",
+            pct(stats.related_found, stats.successful),
         )
 
         console.print(field_table)
@@ -216,11 +223,11 @@ def print_sample_output(incident: Any) -> None:
     table.add_column("Field", style="cyan", width=20)
     table.add_column("Value", overflow="fold")
 
-    table.add_row("Headline", incident.headline[:100] + "..." if len(incident.headline) > 100 else incident.headline)
+    table.add_row("Headline", truncate(incident.headline, 100))
     table.add_row("Occurred", incident.occurred)
     table.add_row("Countries", ", ".join(incident.countries) if incident.countries else "[dim]None[/dim]")
     table.add_row("Sectors", ", ".join(incident.sectors[:3]) + ("..." if len(incident.sectors) > 3 else "") if incident.sectors else "[dim]None[/dim]")
-    table.add_row("Description", (incident.description[:150] + "...") if incident.description and len(incident.description) > 150 else (incident.description or "[dim]None[/dim]"))
+    table.add_row("Description", truncate(incident.description, 150) if incident.description else "[dim]None[/dim]")
     table.add_row("Source Links", str(len(incident.source_links)) if incident.source_links else "[dim]0[/dim]")
     table.add_row("Related", str(len(incident.related_incidents)) if incident.related_incidents else "[dim]0[/dim]")
     table.add_row("Page Scraped", "[green]Yes[/green]" if incident.page_scraped else "[yellow]No[/yellow]")
@@ -1,9 +1,13 @@
 """CSV parser for AIAAIC Google Sheets data."""
 
 import csv
-import re
+import hashlib
+import os
 import subprocess
+import sys
 from io import StringIO
+from itertools import islice
+from pathlib import Path
 from typing import Iterator
 
 import httpx
@@ -11,6 +15,7 @@ import httpx
 from .models import AIAAICIncident, ExternalHarms, InternalImpacts
 
 CSV_URL = "https://docs.google.com/spreadsheets/d/1Bn55B4xz21-_Rgdr8BBb2lt0n_4rzLGxFADMlVW0PYI/export?format=csv&gid=888071280"
+CSV_CACHE_DIR = Path.home() / ".cache" / "aiaaic"
 
 # Column indices (0-based) based on the CSV structure
 COL_AIAAIC_ID = 0
@@ -36,35 +41,71 @@ COL_IMPACTS_FINANCIAL = 17
 COL_IMPACTS_LEGAL = 18
 # Summary/links
 COL_DETAIL_URL = 19
+NUM_COLUMNS = COL_DETAIL_URL + 1
 
 
 def split_field(value: str) -> list[str]:
     """Split a semicolon-separated field into a list of values."""
-    if not value or not value.strip():
+    if not value:
         return []
-    # Split on "; " or ";" and strip whitespace
-    parts = re.split(r";\s*", value.strip())
-    return [p.strip() for p in parts if p.strip()]
+    # Split on ";" and strip whitespace (plain str.split, no regex engine per field).
+    # Tag values repeat across thousands of rows, so intern them to share one object.
+    return [sys.intern(p) for p in (part.strip() for part in value.split(";")) if p]
 
 
-def download_csv(url: str = CSV_URL) -> str:
+def csv_cache_paths(url: str = CSV_URL) -> tuple[Path, Path]:
+    """Return the (csv, etag) cache files for a CSV URL."""
+    key = hashlib.sha1(url.encode()).hexdigest()[:16]
+    return CSV_CACHE_DIR / f"{key}.csv", CSV_CACHE_DIR / f"{key}.etag"
+
+
+def download_csv(url: str = CSV_URL, use_cache: bool = True) -> str:
     """Download CSV content from Google Sheets.
 
     Uses curl subprocess as httpx has issues with Google's cross-origin redirects.
+    The export is requested compressed (curl decodes it), and HTTP errors fail
+    instead of returning an error page as CSV.
+
+    With use_cache, the last download is kept under CSV_CACHE_DIR and revalidated
+    with If-None-Match / If-Modified-Since; a 304 reads the local copy instead.
     """
-    result = subprocess.run(
-        [
-            "curl", "-sL",
-            "-H", "User-Agent: Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
-            url
-        ],
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"curl failed with code {result.returncode}: {result.stderr}")
-    return result.stdout
+    cmd = [
+        "curl", "-sL", "--fail", "--compressed",
+        "-H", "User-Agent: Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
+    ]
+    if not use_cache:
+        result = subprocess.run([*cmd, url], capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            raise RuntimeError(f"curl failed with code {result.returncode}: {result.stderr}")
+        return result.stdout
+
+    cache_path, etag_path = csv_cache_paths(url)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # curl writes both files as the response arrives; they only replace the cache after a full 200
+    tmp_path = cache_path.with_suffix(".tmp")
+    etag_tmp_path = etag_path.with_suffix(".etag.tmp")
+    cmd += ["--remote-time", "-o", str(tmp_path), "-w", "%{http_code}", "--etag-save", str(etag_tmp_path)]
+    if cache_path.exists():
+        # Conditional GET: ETag when the server sent one, else the cached file's Last-Modified mtime
+        cmd += ["-z", str(cache_path)]
+        if etag_path.exists() and etag_path.stat().st_size:
+            cmd += ["--etag-compare", str(etag_path)]
+
+    try:
+        result = subprocess.run([*cmd, url], capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            raise RuntimeError(f"curl failed with code {result.returncode}: {result.stderr}")
+        if result.stdout.strip() != "304" and tmp_path.exists():  # 200: replace the copy and its ETag together
+            os.replace(tmp_path, cache_path)
+            if etag_tmp_path.exists():
+                os.replace(etag_tmp_path, etag_path)
+            else:
+                etag_path.unlink(missing_ok=True)
+    finally:
+        # Not modified, curl error or timeout: drop whatever curl left behind
+        tmp_path.unlink(missing_ok=True)
+        etag_tmp_path.unlink(missing_ok=True)
+    return cache_path.read_text(encoding="utf-8")
 
 
 def parse_csv_row(row: list[str]) -> AIAAICIncident | None:
@@ -72,45 +113,63 @@ def parse_csv_row(row: list[str]) -> AIAAICIncident | None:
 
     Returns None if the row should be skipped (empty AIAAIC ID).
     """
+    # Pad/trim once to the known width, then unpack in COL_* order
+    if len(row) != NUM_COLUMNS:
+        row = (row + [""] * NUM_COLUMNS)[:NUM_COLUMNS]
+    (aiaaic_id, headline, occurred, countries, sectors, deployers, developers,
+     system_names, technologies, purposes, news_triggers, issues,
+     harms_individual, harms_societal, harms_environmental,
+     impacts_strategic, impacts_operational, impacts_financial, impacts_legal,
+     detail_url) = row
+
     # Skip rows with empty AIAAIC ID
-    aiaaic_id = row[COL_AIAAIC_ID].strip() if len(row) > COL_AIAAIC_ID else ""
+    aiaaic_id = aiaaic_id.strip()
     if not aiaaic_id:
         return None
 
     # Extract detail page URL
-    detail_url = row[COL_DETAIL_URL].strip() if len(row) > COL_DETAIL_URL else ""
+    detail_url = detail_url.strip()
     if detail_url and "aiaaic.org" not in detail_url:
         detail_url = None  # Invalid URL
 
     return AIAAICIncident(
         aiaaic_id=aiaaic_id,
-        headline=row[COL_HEADLINE].strip() if len(row) > COL_HEADLINE else "",
-        occurred=row[COL_OCCURRED].strip() if len(row) > COL_OCCURRED else "",
-        countries=split_field(row[COL_COUNTRIES]) if len(row) > COL_COUNTRIES else [],
-        sectors=split_field(row[COL_SECTORS]) if len(row) > COL_SECTORS else [],
-        deployers=split_field(row[COL_DEPLOYERS]) if len(row) > COL_DEPLOYERS else [],
-        developers=split_field(row[COL_DEVELOPERS]) if len(row) > COL_DEVELOPERS else [],
-        system_names=split_field(row[COL_SYSTEM_NAMES]) if len(row) > COL_SYSTEM_NAMES else [],
-        technologies=split_field(row[COL_TECHNOLOGIES]) if len(row) > COL_TECHNOLOGIES else [],
-        purposes=split_field(row[COL_PURPOSES]) if len(row) > COL_PURPOSES else [],
-        news_triggers=split_field(row[COL_NEWS_TRIGGERS]) if len(row) > COL_NEWS_TRIGGERS else [],
-        issues=split_field(row[COL_ISSUES]) if len(row) > COL_ISSUES else [],
+        headline=headline.strip(),
+        occurred=occurred.strip(),
+        countries=split_field(countries),
+        sectors=split_field(sectors),
+        deployers=split_field(deployers),
+        developers=split_field(developers),
+        system_names=split_field(system_names),
+        technologies=split_field(technologies),
+        purposes=split_field(purposes),
+        news_triggers=split_field(news_triggers),
+        issues=split_field(issues),
         external_harms=ExternalHarms(
-            individual=split_field(row[COL_HARMS_INDIVIDUAL]) if len(row) > COL_HARMS_INDIVIDUAL else [],
-            societal=split_field(row[COL_HARMS_SOCIETAL]) if len(row) > COL_HARMS_SOCIETAL else [],
-            environmental=split_field(row[COL_HARMS_ENVIRONMENTAL]) if len(row) > COL_HARMS_ENVIRONMENTAL else [],
+            individual=split_field(harms_individual),
+            societal=split_field(harms_societal),
+            environmental=split_field(harms_environmental),
         ),
         internal_impacts=InternalImpacts(
-            strategic_reputational=split_field(row[COL_IMPACTS_STRATEGIC]) if len(row) > COL_IMPACTS_STRATEGIC else [],
-            operational=split_field(row[COL_IMPACTS_OPERATIONAL]) if len(row) > COL_IMPACTS_OPERATIONAL else [],
-            financial=split_field(row[COL_IMPACTS_FINANCIAL]) if len(row) > COL_IMPACTS_FINANCIAL else [],
-            legal_regulatory=split_field(row[COL_IMPACTS_LEGAL]) if len(row) > COL_IMPACTS_LEGAL else [],
+            strategic_reputational=split_field(impacts_strategic),
+            operational=split_field(impacts_operational),
+            financial=split_field(impacts_financial),
+            legal_regulatory=split_field(impacts_legal),
         ),
         detail_page_url=detail_url if detail_url else None,
         page_scraped=False,
     )
 
 
+def iter_data_rows(csv_content: str) -> Iterator[list[str]]:
+    """Yield raw CSV data rows, skipping the title, header and sub-header rows."""
+    reader = csv.reader(StringIO(csv_content))
+
+    # Skip first 3 rows (title, header, sub-header) without materializing the rest
+    # Data starts at row 4 (index 3)
+    return islice(reader, 3, None)
+
+
 def parse_csv(csv_content: str) -> Iterator[AIAAICIncident]:
     """Parse CSV content and yield AIAAICIncident objects.
 
@@ -120,18 +179,25 @@ def parse_csv(csv_content: str) -> Iterator[AIAAICIncident]:
     - Row 3: Sub-header for External harms/Internal impacts
     - Rows with empty AIAAIC ID
     """
-    reader = csv.reader(StringIO(csv_content))
-    rows = list(reader)
-
-    # Skip first 3 rows (title, header, sub-header)
-    # Data starts at row 4 (index 3)
-    for row in rows[3:]:
+    for row in iter_data_rows(csv_content):
         incident = parse_csv_row(row)
         if incident is not None:
             yield incident
 
 
-def fetch_incidents(url: str = CSV_URL) -> list[AIAAICIncident]:
+def fetch_incidents(url: str = CSV_URL, use_cache: bool = True) -> list[AIAAICIncident]:
     """Download CSV and parse all incidents."""
-    csv_content = download_csv(url)
+    csv_content = download_csv(url, use_cache=use_cache)
     return list(parse_csv(csv_content))
+
+
+def find_incident(aiaaic_id: str, url: str = CSV_URL, use_cache: bool = True) -> AIAAICIncident | None:
+    """Download CSV and parse only the incident with this ID (None if absent).
+
+    Compares the raw ID cell first, so other rows are never built into models,
+    and stops at the first match.
+    """
+    for row in iter_data_rows(download_csv(url, use_cache=use_cache)):
+        if row and row[COL_AIAAIC_ID].strip() == aiaaic_id:
+            return parse_csv_row(row)
+    return None
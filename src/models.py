@@ -1,11 +1,12 @@
 """Pydantic models for AIAAIC incident data."""
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExternalHarms(BaseModel):
     """External harms caused by the incident."""
+    model_config = ConfigDict(defer_build=True)
     individual: list[str] = Field(default_factory=list)
     societal: list[str] = Field(default_factory=list)
     environmental: list[str] = Field(default_factory=list)
@@ -13,6 +14,7 @@ class ExternalHarms(BaseModel):
 
 class InternalImpacts(BaseModel):
     """Internal impacts on the organization."""
+    model_config = ConfigDict(defer_build=True)
     strategic_reputational: list[str] = Field(default_factory=list)
     operational: list[str] = Field(default_factory=list)
     financial: list[str] = Field(default_factory=list)
@@ -21,18 +23,21 @@ class InternalImpacts(BaseModel):
 
 class SourceLink(BaseModel):
     """A source/reference link for the incident."""
+    model_config = ConfigDict(defer_build=True)
     url: str
     title: str | None = None
 
 
 class RelatedIncident(BaseModel):
     """A related incident reference."""
+    model_config = ConfigDict(defer_build=True)
     title: str
     url: str
 
 
 class AIAAICIncident(BaseModel):
     """Complete AIAAIC incident record."""
+    model_config = ConfigDict(defer_build=True)
 
     # Identifiers
     aiaaic_id: str = Field(..., description="e.g., AIAAIC2155")
@@ -66,6 +71,7 @@ class AIAAICIncident(BaseModel):
 
 class ScrapingError(BaseModel):
     """Record of a scraping error for retry purposes."""
+    model_config = ConfigDict(defer_build=True)
     aiaaic_id: str
     url: str | None
     error_type: str
@@ -2,17 +2,25 @@
 
 Uses robust text-pattern extraction instead of CSS class selectors,
 since Google Sites uses auto-generated class names that can change.
+Pages are parsed with lxml.html directly; text is read the way
+BeautifulSoup's get_text(strip=True) reads it (see _get_text).
 """
 
+import asyncio
 import re
 from dataclasses import dataclass
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin, urlsplit
 
-import httpx
-from bs4 import BeautifulSoup
+from lxml.etree import ParserError
+from lxml.html import HtmlElement, document_fromstring
 
 from .models import RelatedIncident, SourceLink
 
+if TYPE_CHECKING:
+    # httpx (and the CLI deps it pulls in) is only needed to fetch pages
+    import httpx
+
 # Boilerplate text patterns to filter out
 BOILERPLATE_PATTERNS = [
     "Report incident",
@@ -27,6 +35,13 @@ BOILERPLATE_PATTERNS = [
     "Search this site",
 ]
 
+# URLs to skip in source links (not actual news sources)
+SKIP_URL_PATTERNS = [
+    "facebook.com/sharer", "twitter.com/intent", "linkedin.com/share",
+    "linktree", "gstatic.com", "google.com/url", "docs.google.com/forms",
+    "docs.google.com/spreadsheets", "wikipedia.org", "doubao.com",
+]
+
 # Base URL for resolving relative links
 BASE_URL = "https://www.aiaaic.org"
 
@@ -48,6 +63,24 @@ METADATA_FIELD_PATTERNS = [
     r"^Technolog\w*\s*:",      # Technology: or Technologies:
 ]
 
+# Compiled once at import; these run for every paragraph of every page
+_METADATA_FIELD_RES = [re.compile(p, re.IGNORECASE) for p in METADATA_FIELD_PATTERNS]
+# Case-insensitive so callers needn't lower() (copy) the whole string first
+_BOILERPLATE_RE = re.compile(
+    "|".join(re.escape(bp) for bp in BOILERPLATE_PATTERNS), re.IGNORECASE
+)
+_SKIP_URL_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in SKIP_URL_PATTERNS), re.IGNORECASE
+)
+_TRACKING_PARAM_RE = re.compile(r"(?:utm_[^=&]*|fbclid|gclid|mc_[a-z]+)(?:=|$)", re.IGNORECASE)
+_OCCURRED_RE = re.compile(
+    r"Occurred:\s*([A-Za-z0-9\s,]+?)(?:\s*Page published|\s*$|\n)", re.IGNORECASE
+)
+_PUBLISHED_RE = re.compile(
+    r"Page published:\s*([A-Za-z0-9\s,]+?)(?:\s*$|\n|Report)", re.IGNORECASE
+)
+_URL_RE = re.compile(r'https?://[^\s<>"\'\\]+[^\s<>"\'\\.,;:!?\)\]\}]')
+
 # Narrative section headings to preserve in description
 NARRATIVE_HEADINGS = [
     "What happened",
@@ -58,12 +91,15 @@ NARRATIVE_HEADINGS = [
     "Definitions",
 ]
 
+# Tags whose text is code or markup rather than page content
+NON_TEXT_TAGS = ("script", "style", "template")
+
 # Minimum content thresholds
 MIN_PARAGRAPH_LENGTH = 40
 MIN_DESCRIPTION_LENGTH = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class PageData:
     """Data extracted from an AIAAIC incident page."""
 
@@ -74,12 +110,54 @@ class PageData:
     occurred_from_page: str | None = None
 
 
+def _get_text(element: HtmlElement, separator: str = "") -> str:
+    """Join the element's non-empty text nodes, each stripped of whitespace.
+
+    Matches BeautifulSoup's get_text(separator, strip=True): comments are
+    skipped, and _parse_html() empties script/style/template tags first.
+    """
+    return separator.join(text for text in map(str.strip, element.itertext()) if text)
+
+
+def _parse_html(html: str) -> HtmlElement:
+    """Parse page HTML, tolerating empty documents and XML declarations."""
+    try:
+        root = document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that declares its own encoding
+        root = document_fromstring(html.encode())
+    except ParserError:
+        # Empty document: extract from an empty page rather than fail
+        root = document_fromstring("<html></html>")
+    for element in root.iter(*NON_TEXT_TAGS):
+        for node in element.iter():
+            node.text = None
+            if node is not element:
+                node.tail = None
+    return root
+
+
 def is_boilerplate(text: str) -> bool:
     """Check if text is boilerplate/navigation content."""
-    if len(text) < 30:
-        return True
-    text_lower = text.lower()
-    return any(bp.lower() in text_lower for bp in BOILERPLATE_PATTERNS)
+    return len(text) < 30 or _BOILERPLATE_RE.search(text) is not None
+
+
+def _canonical_url(url: str) -> str:
+    """Key for spotting the same source URL written differently.
+
+    Host and scheme case, a trailing slash, the fragment and tracking
+    parameters (utm_*, fbclid, gclid, mc_*) are ignored.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param and not _TRACKING_PARAM_RE.match(param)
+    )
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    return f"{key}?{query}" if query else key
 
 
 def extract_metadata_from_text(text: str) -> tuple[str | None, str | None]:
@@ -92,65 +170,54 @@ def extract_metadata_from_text(text: str) -> tuple[str | None, str | None]:
     page_published = None
 
     # Try to find "Occurred: <date>"
-    occurred_match = re.search(
-        r"Occurred:\s*([A-Za-z0-9\s,]+?)(?:\s*Page published|\s*$|\n)",
-        text,
-        re.IGNORECASE,
-    )
+    occurred_match = _OCCURRED_RE.search(text)
     if occurred_match:
         occurred = occurred_match.group(1).strip()
 
     # Try to find "Page published: <date>"
-    published_match = re.search(
-        r"Page published:\s*([A-Za-z0-9\s,]+?)(?:\s*$|\n|Report)",
-        text,
-        re.IGNORECASE,
-    )
+    published_match = _PUBLISHED_RE.search(text)
     if published_match:
         page_published = published_match.group(1).strip()
 
     return occurred, page_published
 
 
-def extract_text_urls(soup: BeautifulSoup) -> list[str]:
+def extract_text_urls(root: HtmlElement) -> list[str]:
     """Extract URLs that appear as plain text (not in <a> tags).
 
     Many AIAAIC pages list source URLs as underlined text in <span> elements
     rather than as proper hyperlinks.
     """
-    urls: list[str] = []
-
-    # URL regex pattern
-    url_pattern = re.compile(r'https?://[^\s<>"\'\\]+[^\s<>"\'\\.,;:!?\)\]\}]')
-
-    # Find spans with underline styling (common pattern for text URLs)
-    for span in soup.find_all("span", style=True):
-        style = span.get("style", "")
-        if "underline" in style:
-            text = span.get_text(strip=True)
-            if text.startswith("http"):
-                urls.append(text)
-
-    # Also look for URLs in list items that aren't wrapped in <a> tags
-    for li in soup.find_all("li"):
-        # Check if this li has no anchor children but contains a URL
-        if not li.find("a"):
-            text = li.get_text(strip=True)
-            matches = url_pattern.findall(text)
-            urls.extend(matches)
-
-    # Look for URLs in paragraphs without links
-    for p in soup.find_all("p"):
-        if not p.find("a"):
-            text = p.get_text(strip=True)
-            matches = url_pattern.findall(text)
-            urls.extend(matches)
-
-    return urls
+    span_urls: list[str] = []
+    li_texts: list[str] = []
+    p_texts: list[str] = []
+
+    # One walk over the tree; results keep the span, li, p grouping order
+    for tag in root.iter("span", "li", "p"):
+        if tag.tag == "span":
+            # Spans with underline styling (common pattern for text URLs)
+            if "underline" in tag.get("style", ""):
+                text = _get_text(tag)
+                if text.startswith("http"):
+                    span_urls.append(text)
+        # List items and paragraphs with URLs that aren't wrapped in <a> tags
+        elif tag.find(".//a") is None:
+            (li_texts if tag.tag == "li" else p_texts).append(_get_text(tag))
+
+    # _URL_RE never matches across whitespace, so one scan over the
+    # newline-joined texts finds the same URLs as a scan per tag
+    return (
+        span_urls
+        + _URL_RE.findall("\n".join(li_texts))
+        + _URL_RE.findall("\n".join(p_texts))
+    )
 
 
 def extract_links(
-    soup: BeautifulSoup, current_url: str
+    root: HtmlElement,
+    current_url: str,
+    sections: list[HtmlElement],
+    section_texts: list[str],
 ) -> tuple[list[SourceLink], list[RelatedIncident]]:
     """Extract source links and related incidents from page.
 
@@ -163,6 +230,8 @@ def extract_links(
 
     Uses URL patterns instead of CSS classes.
     Also extracts plain text URLs that aren't wrapped in <a> tags.
+    sections and section_texts are the page's <section> elements and their
+    text, as built once by parse_page().
     """
     source_links: list[SourceLink] = []
     related_incidents: list[RelatedIncident] = []
@@ -172,41 +241,31 @@ def extract_links(
     # Normalize current URL for comparison
     current_path = current_url.replace(BASE_URL, "").rstrip("/")
 
-    # Get all sections
-    sections = soup.find_all("section")
-
-    # URLs to skip (not actual news sources)
-    skip_patterns = [
-        "facebook.com/sharer", "twitter.com/intent", "linkedin.com/share",
-        "linktree", "gstatic.com", "google.com/url", "docs.google.com/forms",
-        "docs.google.com/spreadsheets", "wikipedia.org", "doubao.com",
-    ]
-
     # Process each section (except last which is footer)
-    for section in sections[:-1] if len(sections) > 1 else sections:
-        section_text = section.get_text(strip=True)
-
+    content_sections = sections[:-1] if len(sections) > 1 else sections
+    for section, section_text in zip(content_sections, section_texts):
         # Check if this is the "Related" section
-        is_related_section = section_text.lower().startswith("related")
+        is_related_section = _is_related_section(section_text)
 
-        for link in section.find_all("a", href=True):
-            href = link.get("href", "").strip()
+        for link in section.iterdescendants("a"):
+            if "href" not in link.attrib:
+                continue
+            href = link.get("href").strip()
             if not href or href.startswith("#") or href.startswith("javascript:"):
                 continue
 
-            title = link.get_text(strip=True)
-
             # Handle external links (source links)
             if href.startswith("http") and "aiaaic.org" not in href:
-                # Skip non-news links
-                if any(pattern in href.lower() for pattern in skip_patterns):
+                url_key = _canonical_url(href)
+                if url_key in seen_source_urls:
                     continue
-
-                if href in seen_source_urls:
+                # Skip non-news links
+                if _SKIP_URL_RE.search(href):
                     continue
-                seen_source_urls.add(href)
+                seen_source_urls.add(url_key)
 
                 # Clean up title
+                title = _get_text(link)
                 if not title or is_boilerplate(title) or title.startswith("http"):
                     title = None
 
@@ -223,23 +282,25 @@ def extract_links(
                     continue
                 seen_related_urls.add(full_url)
 
+                title = _get_text(link)
                 if title and not is_boilerplate(title):
                     related_incidents.append(
                         RelatedIncident(title=title, url=full_url)
                     )
 
     # Also extract plain text URLs (not in <a> tags)
-    text_urls = extract_text_urls(soup)
+    text_urls = extract_text_urls(root)
     for url in text_urls:
         # Skip if already seen or matches skip patterns
-        if url in seen_source_urls:
+        url_key = _canonical_url(url)
+        if url_key in seen_source_urls:
             continue
-        if any(pattern in url.lower() for pattern in skip_patterns):
+        if _SKIP_URL_RE.search(url):
             continue
         if "aiaaic.org" in url:
             continue
 
-        seen_source_urls.add(url)
+        seen_source_urls.add(url_key)
         source_links.append(SourceLink(url=url, title=None))
 
     return source_links, related_incidents
@@ -251,37 +312,40 @@ def _is_metadata_section(text: str) -> bool:
     if "Occurred:" in text and "Page published:" in text:
         return True
     # Section 3: Has multiple metadata field names
-    metadata_count = sum(
-        1 for pattern in METADATA_FIELD_PATTERNS
-        if re.search(pattern, text, re.IGNORECASE)
-    )
+    metadata_count = sum(1 for pattern in _METADATA_FIELD_RES if pattern.search(text))
     return metadata_count >= 3
 
 
+def _is_related_section(text: str) -> bool:
+    """Check if section text starts the "Related" incidents section."""
+    return text.lower().startswith("related")
+
+
 def _is_metadata_line(text: str) -> bool:
     """Check if text line starts a metadata field (stop extraction here)."""
-    return any(re.match(pattern, text, re.IGNORECASE) for pattern in METADATA_FIELD_PATTERNS)
+    return any(pattern.match(text) for pattern in _METADATA_FIELD_RES)
 
 
-def _has_narrative_content(section) -> bool:
+def _has_narrative_content(section: HtmlElement) -> bool:
     """Check if section contains narrative content worth extracting.
 
     Accepts sections with:
     - At least 1 substantial paragraph (>80 chars), OR
     - Total paragraph content >200 chars
     """
-    paragraphs = section.find_all("p")
-    substantial_count = sum(
-        1 for p in paragraphs
-        if len(p.get_text(strip=True)) > 80
-        and not is_boilerplate(p.get_text(strip=True))
-    )
-    # Accept sections with 1+ substantial paragraph
-    if substantial_count >= 1:
-        return True
-    # Also accept if total paragraph content is significant
-    total_content = sum(len(p.get_text(strip=True)) for p in paragraphs)
-    return total_content > 200
+    # Either test passing accepts the section, so stop reading paragraphs
+    # as soon as one does
+    total_content = 0
+    for p in section.iterdescendants("p"):
+        text = _get_text(p)
+        # Accept sections with 1+ substantial paragraph
+        if len(text) > 80 and not is_boilerplate(text):
+            return True
+        # Also accept if total paragraph content is significant
+        total_content += len(text)
+        if total_content > 200:
+            return True
+    return False
 
 
 def _is_narrative_heading(text: str) -> bool:
@@ -290,15 +354,15 @@ def _is_narrative_heading(text: str) -> bool:
     return any(heading.lower() in text_lower for heading in NARRATIVE_HEADINGS)
 
 
-def _extract_paragraphs(section) -> list[str]:
+def _extract_paragraphs(section: HtmlElement) -> list[str]:
     """Extract paragraphs from a section, stopping at metadata boundaries."""
     result = []
 
-    for element in section.find_all(["p", "h2", "h3", "h4"]):
-        text = element.get_text(strip=True)
+    for element in section.iterdescendants("p", "h2", "h3", "h4"):
+        text = _get_text(element)
 
         # Handle headings FIRST - preserve short narrative headings like "What happened"
-        if element.name in ["h2", "h3", "h4"]:
+        if element.tag in ["h2", "h3", "h4"]:
             if _is_narrative_heading(text):
                 result.append(f"**{text}**")
             continue  # Always skip to next element after handling heading
@@ -324,29 +388,29 @@ def _extract_paragraphs(section) -> list[str]:
     return result
 
 
-def _fallback_extraction(soup: BeautifulSoup) -> str | None:
+def _fallback_extraction(root: HtmlElement) -> str | None:
     """Fallback extraction strategies when section-based approach fails."""
     # Strategy: Look for bold/strong text that might be a summary
-    for bold in soup.find_all(["b", "strong"]):
-        text = bold.get_text(strip=True)
+    for bold in root.iter("b", "strong"):
+        text = _get_text(bold)
         if len(text) > 50 and not is_boilerplate(text):
-            parent = bold.parent
-            if parent:
-                parent_text = parent.get_text(strip=True)
+            parent = bold.getparent()
+            if parent is not None:
+                parent_text = _get_text(parent)
                 if len(parent_text) > len(text) and len(parent_text) < 1000:
                     return parent_text
             return text
 
     # Strategy: og:description meta tag
-    og_desc = soup.find("meta", property="og:description")
-    if og_desc:
+    og_desc = root.find('.//meta[@property="og:description"]')
+    if og_desc is not None:
         content = og_desc.get("content", "").strip()
         if content and len(content) > 20:
             return content
 
     # Strategy: itemprop description
-    itemprop_desc = soup.find("meta", attrs={"itemprop": "description"})
-    if itemprop_desc:
+    itemprop_desc = root.find('.//meta[@itemprop="description"]')
+    if itemprop_desc is not None:
         content = itemprop_desc.get("content", "").strip()
         if content and len(content) > 20:
             return content
@@ -354,7 +418,9 @@ def _fallback_extraction(soup: BeautifulSoup) -> str | None:
     return None
 
 
-def extract_description(soup: BeautifulSoup) -> str | None:
+def extract_description(
+    root: HtmlElement, sections: list[HtmlElement], section_texts: list[str]
+) -> str | None:
     """Extract complete multi-paragraph description from the page.
 
     AIAAIC pages have a consistent structure:
@@ -370,20 +436,16 @@ def extract_description(soup: BeautifulSoup) -> str | None:
     3. Join with double newlines
     4. Fall back to meta tags if section-based extraction fails
     """
-    sections = soup.find_all("section")
-
     # Strategy 1: Section-based extraction (preferred for multi-paragraph)
     if len(sections) >= 3:
         # Skip first section (title) and last section (footer)
-        for section in sections[1:-1]:
-            section_text = section.get_text(strip=True)
-
+        for section, section_text in zip(sections[1:-1], section_texts[1:-1]):
             # Skip metadata sections
             if _is_metadata_section(section_text):
                 continue
 
             # Skip "Related" sections
-            if section_text.lower().startswith("related"):
+            if _is_related_section(section_text):
                 continue
 
             # Check if this section has narrative content
@@ -395,8 +457,8 @@ def extract_description(soup: BeautifulSoup) -> str | None:
                         return description
 
     # Strategy 2: Try role="main" area
-    main = soup.find(attrs={"role": "main"})
-    if main:
+    main = root if root.get("role") == "main" else root.find('.//*[@role="main"]')
+    if main is not None:
         paragraphs = _extract_paragraphs(main)
         if paragraphs:
             description = "\n\n".join(paragraphs)
@@ -404,10 +466,10 @@ def extract_description(soup: BeautifulSoup) -> str | None:
                 return description
 
     # Strategy 3: Fallback to meta tags and bold text
-    return _fallback_extraction(soup)
+    return _fallback_extraction(root)
 
 
-async def fetch_page(client: httpx.AsyncClient, url: str) -> str:
+async def fetch_page(client: "httpx.AsyncClient", url: str) -> str:
     """Fetch page HTML content."""
     response = await client.get(url, follow_redirects=True)
     response.raise_for_status()
@@ -416,19 +478,29 @@ async def fetch_page(client: httpx.AsyncClient, url: str) -> str:
 
 def parse_page(html: str, url: str) -> PageData:
     """Parse HTML content and extract structured data."""
-    soup = BeautifulSoup(html, "lxml")
-
-    # Get full page text for regex extraction
-    page_text = soup.get_text(separator="\n", strip=True)
-
-    # Extract metadata using text patterns
-    occurred, page_published = extract_metadata_from_text(page_text)
+    root = _parse_html(html)
+
+    # Sections and their text are shared by all extractors below
+    sections = list(root.iter("section"))
+    section_texts = [_get_text(section) for section in sections]
+
+    # Extract metadata using text patterns. Occurred/Page published sit in
+    # the second section, so read the full page text only if one is missing
+    occurred = page_published = None
+    if len(sections) > 1:
+        occurred, page_published = extract_metadata_from_text(_get_text(sections[1], "\n"))
+    if occurred is None or page_published is None:
+        full_occurred, full_published = extract_metadata_from_text(_get_text(root, "\n"))
+        if occurred is None:
+            occurred = full_occurred
+        if page_published is None:
+            page_published = full_published
 
     # Extract links using URL patterns
-    source_links, related_incidents = extract_links(soup, url)
+    source_links, related_incidents = extract_links(root, url, sections, section_texts)
 
     # Extract description using structural heuristics
-    description = extract_description(soup)
+    description = extract_description(root, sections, section_texts)
 
     return PageData(
         description=description,
@@ -439,10 +511,16 @@ def parse_page(html: str, url: str) -> PageData:
     )
 
 
-async def scrape_page(client: httpx.AsyncClient, url: str) -> PageData:
-    """Fetch and parse an AIAAIC incident page."""
+async def scrape_page(client: "httpx.AsyncClient", url: str) -> PageData:
+    """Fetch and parse an AIAAIC incident page.
+
+    Pass one shared client for a whole run (run_scraper() builds it with
+    HTTP/2 and a keep-alive pool sized to the concurrency), so pages reuse
+    open connections instead of a TLS handshake each. Parsing runs in a
+    worker thread so the event loop keeps serving the other requests.
+    """
     html = await fetch_page(client, url)
-    return parse_page(html, url)
+    return await asyncio.to_thread(parse_page, html, url)
 
 
 def scrape_page_sync(url: str) -> PageData:
@@ -451,6 +529,8 @@ def scrape_page_sync(url: str) -> PageData:
     Creates a temporary httpx client for the request.
     Use this for --single mode or one-off scrapes.
     """
+    import httpx
+
     response = httpx.get(url, follow_redirects=True, timeout=30.0)
     response.raise_for_status()
     return parse_page(response.text, url)
@@ -1,7 +1,9 @@
 """Main scraper orchestration for AIAAIC database."""
 
 import asyncio
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Callable
 
@@ -13,6 +15,8 @@ from .csv_parser import CSV_URL, fetch_incidents
 from .models import AIAAICIncident, ScrapingError
 from .page_scraper import scrape_page
 from .utils import (
+    FLUSH_INTERVAL,
+    JsonlWriter,
     append_error,
     append_incident,
     clear_errors,
@@ -33,23 +37,72 @@ RETRY_BACKOFF = [1, 2, 5]  # seconds
 DEFAULT_CONCURRENCY = 20  # Parallel requests (was 10)
 
 
+class AdaptiveLimiter:
+    """Concurrency limit that backs off when the server pushes back (AIMD).
+
+    Rate-limit responses halve the limit (at most once per
+    DECREASE_INTERVAL, so a burst of 429s from requests already in flight
+    counts once); every INCREASE_AFTER successes raise it by one, back up
+    to max_limit.
+    """
+
+    DECREASE_INTERVAL = 1.0  # seconds
+    INCREASE_AFTER = 10
+
+    def __init__(self, max_limit: int, min_limit: int = 2) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.limit = max_limit
+        self._active = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._slot_free = asyncio.Event()
+
+    async def acquire(self) -> None:
+        while self._active >= self.limit:
+            self._slot_free.clear()
+            await self._slot_free.wait()
+        self._active += 1
+
+    def release(self) -> None:
+        self._active -= 1
+        self._slot_free.set()
+
+    def record_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.INCREASE_AFTER and self.limit < self.max_limit:
+            self.limit += 1
+            self._successes = 0
+            self._slot_free.set()
+
+    def decrease(self) -> None:
+        self._successes = 0
+        now = time.monotonic()
+        if now - self._last_decrease >= self.DECREASE_INTERVAL:
+            self.limit = max(self.min_limit, self.limit // 2)
+            self._last_decrease = now
+
+
 async def scrape_single_incident(
     client: httpx.AsyncClient,
     incident: AIAAICIncident,
     stats: ScrapeStats,
-    output_path: Path,
-    errors_path: Path,
+    output: JsonlWriter,
+    errors: JsonlWriter,
     verbose: bool = False,
+    limiter: AdaptiveLimiter | None = None,
 ) -> bool:
     """Scrape a single incident's detail page and update the record.
 
+    If a limiter is given, it is told about successes and rate limiting.
+
     Returns True if successful, False otherwise.
     """
     if not incident.detail_page_url:
         # No URL to scrape, just save the CSV data
         stats.no_url += 1
         incident.page_scraped = False
-        append_incident(output_path, incident)
+        append_incident(output, incident)
         if verbose:
             con.print_incident_status(
                 incident.aiaaic_id, incident.headline, "skip", "no detail URL"
@@ -79,7 +132,9 @@ async def scrape_single_incident(
                 stats.related_found += 1
 
             # Save to file
-            append_incident(output_path, incident)
+            append_incident(output, incident)
+            if limiter:
+                limiter.record_success()
 
             if verbose:
                 details = []
@@ -100,15 +155,17 @@ async def scrape_single_incident(
             if e.response.status_code == 404:
                 # Page doesn't exist, skip it
                 incident.page_scraped = False
-                append_incident(output_path, incident)
+                append_incident(output, incident)
                 if verbose:
                     con.print_incident_status(
                         incident.aiaaic_id, incident.headline, "warning", "404 not found"
                     )
                 return True
             elif e.response.status_code in (429, 503):
-                # Rate limited or server overloaded, retry
+                # Rate limited or server overloaded: throttle, then retry
                 last_error = e
+                if limiter:
+                    limiter.decrease()
                 if attempt < len(RETRY_BACKOFF) - 1:
                     await asyncio.sleep(backoff)
                     continue
@@ -133,7 +190,7 @@ async def scrape_single_incident(
         error_type=type(last_error).__name__ if last_error else "Unknown",
         error_message=str(last_error) if last_error else "Unknown error",
     )
-    append_error(errors_path, error)
+    append_error(errors, error)
 
     if verbose:
         con.print_incident_status(
@@ -156,24 +213,31 @@ async def scrape_batch(
     on_progress: Callable[[int], None] | None = None,
 ) -> None:
     """Scrape a batch of incidents concurrently."""
-    semaphore = asyncio.Semaphore(concurrency)
+    limiter = AdaptiveLimiter(concurrency)
 
     # Configure client for high-throughput scraping
     limits = httpx.Limits(
         max_connections=concurrency + 10,  # Allow extra connections
         max_keepalive_connections=concurrency,
+        # Outlive the retry backoff sleeps, so retries reuse their connection
+        keepalive_expiry=max(RETRY_BACKOFF) + 25.0,
     )
-    async with httpx.AsyncClient(
-        timeout=REQUEST_TIMEOUT,
-        limits=limits,
-        http2=True,  # Enable HTTP/2 multiplexing if server supports it
-    ) as client:
-
-        async def scrape_with_semaphore(incident: AIAAICIncident) -> bool:
-            async with semaphore:
-                success = await scrape_single_incident(
-                    client, incident, stats, output_path, errors_path, verbose
-                )
+    # One buffered handle per file for the whole batch; records are appended
+    # between awaits on the single event loop thread, so they never interleave
+    with JsonlWriter(output_path) as output, JsonlWriter(errors_path) as errors:
+        async with httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=limits,
+            http2=True,  # Enable HTTP/2 multiplexing if server supports it
+        ) as client:
+
+            async def scrape_and_release(incident: AIAAICIncident) -> None:
+                try:
+                    success = await scrape_single_incident(
+                        client, incident, stats, output, errors, verbose, limiter
+                    )
+                finally:
+                    limiter.release()
                 stats.processed += 1
                 if success:
                     stats.successful += 1
@@ -181,10 +245,25 @@ async def scrape_batch(
                     stats.failed += 1
                 if on_progress:
                     on_progress(1)
-                return success
 
-        # Run all scrapes concurrently (limited by semaphore)
-        await asyncio.gather(*[scrape_with_semaphore(i) for i in incidents])
+            async def flush_periodically() -> None:
+                # Appends only flush on their own while records keep arriving;
+                # this covers stalls such as rate-limit backoff
+                while True:
+                    await asyncio.sleep(FLUSH_INTERVAL)
+                    output.flush()
+                    errors.flush()
+
+            flusher = asyncio.create_task(flush_periodically())
+            try:
+                # Only start a task once a slot is free, so at most `concurrency`
+                # tasks exist at a time instead of one per incident up front
+                async with asyncio.TaskGroup() as tg:
+                    for incident in incidents:
+                        await limiter.acquire()
+                        tg.create_task(scrape_and_release(incident))
+            finally:
+                flusher.cancel()
 
 
 async def run_scraper(
@@ -197,6 +276,7 @@ async def run_scraper(
     concurrency: int = DEFAULT_CONCURRENCY,
     verbose: bool = False,
     target_ids: set[str] | None = None,
+    use_cache: bool = True,
 ) -> ScrapeStats:
     """Run the main scraping process.
 
@@ -210,6 +290,7 @@ async def run_scraper(
         concurrency: Number of concurrent requests
         verbose: If True, print detailed status for each incident
         target_ids: If set, only scrape these specific incident IDs (implies force for those IDs)
+        use_cache: If False, re-download the incident CSV instead of revalidating the cached copy
 
     Returns:
         ScrapeStats with final statistics
@@ -221,17 +302,21 @@ async def run_scraper(
 
     con.print_header()
 
-    # Load already-processed IDs (unless force mode)
+    # Fetch incidents from CSV while the already-processed IDs are loaded
+    # (unless force mode); the download mostly waits on curl
+    con.print_info("Fetching incident list from CSV...")
     processed_ids: set[str] = set()
     error_ids: set[str] = set()
+    fetch = asyncio.to_thread(fetch_incidents, CSV_URL, use_cache=use_cache)
 
-    if not force:
-        processed_ids = load_processed_ids(output_path)
-        error_ids = load_error_ids(errors_path)
-
-    # Fetch incidents from CSV
-    con.print_info("Fetching incident list from CSV...")
-    all_incidents = fetch_incidents(CSV_URL)
+    if force:
+        all_incidents = await fetch
+    else:
+        processed_ids, error_ids, all_incidents = await asyncio.gather(
+            asyncio.to_thread(load_processed_ids, output_path),
+            asyncio.to_thread(load_error_ids, errors_path),
+            fetch,
+        )
     stats.total = len(all_incidents)
 
     # Determine which incidents to process
@@ -258,8 +343,10 @@ async def run_scraper(
         con.print_warning("Update mode not fully implemented - use --force instead")
         incidents_to_process = all_incidents
     else:
-        # Skip already-processed incidents
-        incidents_to_process = [i for i in all_incidents if i.aiaaic_id not in processed_ids]
+        # Skip already-processed incidents; with --sample, stop scanning once
+        # enough are found instead of listing every pending incident first
+        pending = (i for i in all_incidents if i.aiaaic_id not in processed_ids)
+        incidents_to_process = list(islice(pending, sample) if sample else pending)
         stats.skipped = len(processed_ids)
 
     # Apply sample limit
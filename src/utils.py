@@ -1,54 +1,129 @@
 """File I/O utilities for the AIAAIC scraper."""
 
-import json
+import collections
+import hashlib
+import itertools
+import mmap
+import operator
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Iterator
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 from .models import AIAAICIncident, ScrapingError
 
+# Records are serialized by pydantic, which puts aiaaic_id first with no
+# whitespace. A JSON string can't contain an unescaped quote, so this can only
+# match a key, and only the top-level object has aiaaic_id. Lines it misses
+# (e.g. an ID with escapes) fall back to orjson.loads()
+_ID_RE = re.compile(rb'"aiaaic_id"\s*:\s*"([^"\\]*)"')
 
-def load_processed_ids(jsonl_path: Path) -> set[str]:
-    """Load the set of already-processed AIAAIC IDs from the JSONL file."""
+
+def _scan_ids(f: BinaryIO, ids: set[str], digest: "hashlib.blake2b") -> int:
+    """Add the aiaaic_id of each line from f's position on to ids.
+
+    Complete lines are also fed to digest. Returns the offset just past the
+    last newline-terminated line, so a record that is still being written
+    gets rescanned next time.
+    """
+    offset = f.tell()
+    for line in f:
+        if line.endswith(b"\n"):
+            offset += len(line)
+            digest.update(line)
+        match = _ID_RE.search(line)
+        if match:
+            ids.add(match.group(1).decode())
+            continue
+        if line.isspace():
+            continue
+        try:
+            data = orjson.loads(line)
+            if "aiaaic_id" in data:
+                ids.add(data["aiaaic_id"])
+        except orjson.JSONDecodeError:
+            continue
+    return offset
+
+
+def _ids_sidecar(jsonl_path: Path) -> Path:
+    """Path of the ID cache kept next to a JSONL file (see _load_ids)."""
+    return jsonl_path.with_suffix(".ids")
+
+
+def _load_ids(jsonl_path: Path) -> set[str]:
+    """Collect the aiaaic_id of every record in a JSONL file.
+
+    The IDs are also saved to a `.ids` sidecar: an "inode size mtime_ns offset
+    digest" header, then one ID per line, covering the file up to offset. The
+    scraper only appends, so the next run reads the sidecar and scans just the
+    records added since. An unchanged file (same inode, size and mtime) is not
+    read at all; otherwise the sidecar is only trusted if the bytes before
+    offset still hash to digest. Anything else is scanned in full. Functions
+    that rewrite a JSONL file also delete its sidecar.
+    """
     ids: set[str] = set()
     if not jsonl_path.exists():
         return ids
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                if "aiaaic_id" in data:
-                    ids.add(data["aiaaic_id"])
-            except json.JSONDecodeError:
-                continue
+    sidecar_path = _ids_sidecar(jsonl_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(jsonl_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        start = 0
+        try:
+            header, _, body = sidecar_path.read_bytes().partition(b"\n")
+            inode, size, mtime_ns, offset, hexdigest = header.decode().split()
+            inode, size, mtime_ns, offset = int(inode), int(size), int(mtime_ns), int(offset)
+        except (OSError, ValueError):
+            offset = None
+        if offset is not None and inode == stat.st_ino and offset <= stat.st_size:
+            if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                return set(body.decode().split("\n")) - {""}
+            # Appended to (or rewritten in place): check the covered bytes
+            remaining = offset
+            while remaining:
+                chunk = f.read(min(remaining, 1 << 20))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                remaining -= len(chunk)
+            if digest.hexdigest() == hexdigest:
+                ids.update(body.decode().split("\n"))
+                ids.discard("")
+                start = offset
+            else:
+                digest = hashlib.blake2b(digest_size=16)
+        f.seek(start)
+        end = _scan_ids(f, ids, digest)
+
+    header = f"{stat.st_ino} {stat.st_size} {stat.st_mtime_ns} {end} {digest.hexdigest()}\n"
+    try:
+        tmp_path = jsonl_path.with_suffix(".ids.tmp")
+        tmp_path.write_bytes((header + "\n".join(ids)).encode())
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        pass  # e.g. read-only data directory; scan in full next time
 
     return ids
 
 
-def load_error_ids(errors_path: Path) -> set[str]:
-    """Load the set of AIAAIC IDs that had errors."""
-    ids: set[str] = set()
-    if not errors_path.exists():
-        return ids
+def load_processed_ids(jsonl_path: Path) -> set[str]:
+    """Load the set of already-processed AIAAIC IDs from the JSONL file."""
+    return _load_ids(jsonl_path)
 
-    with open(errors_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                if "aiaaic_id" in data:
-                    ids.add(data["aiaaic_id"])
-            except json.JSONDecodeError:
-                continue
 
-    return ids
+def load_error_ids(errors_path: Path) -> set[str]:
+    """Load the set of AIAAIC IDs that had errors."""
+    return _load_ids(errors_path)
 
 
 def load_errors(errors_path: Path) -> Iterator[ScrapingError]:
@@ -56,30 +131,87 @@ def load_errors(errors_path: Path) -> Iterator[ScrapingError]:
     if not errors_path.exists():
         return
 
-    with open(errors_path, "r", encoding="utf-8") as f:
+    with open(errors_path, "rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():  # orjson ignores surrounding whitespace
                 continue
             try:
-                data = json.loads(line)
+                data = orjson.loads(line)
                 yield ScrapingError.model_validate(data)
-            except (json.JSONDecodeError, ValueError):
+            except (orjson.JSONDecodeError, ValueError):
                 continue
 
 
-def append_incident(jsonl_path: Path, incident: AIAAICIncident) -> None:
+# Buffered appends are handed to the OS this often, by the next append or by
+# the owner calling flush() on a timer (scrape_batch does), so a crashed run
+# loses at most this many seconds of scraped records
+FLUSH_INTERVAL = 1.0
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class JsonlWriter:
+    """Append-only JSONL file that stays open and buffers its writes.
+
+    The file is opened on the first append, so an unused writer does not
+    create an empty file. Appends flush once FLUSH_INTERVAL has passed; when
+    appends may stall, call flush() on a timer too. Use as a context manager;
+    closing flushes and fsyncs whatever is still buffered.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: BinaryIO | None = None
+        self._last_flush = 0.0
+
+    def append(self, line: bytes) -> None:
+        """Append one JSON document (without its trailing newline)."""
+        if self._file is None:
+            self._file = open(self.path, "ab", buffering=WRITE_BUFFER_SIZE)
+            self._last_flush = time.monotonic()
+        self._file.write(line + b"\n")
+        if time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to the file (without fsync)."""
+        if self._file is not None:
+            self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush buffered lines to disk and close the file."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@cache
+def _json_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter whose dump_json() gives the same JSON as model_dump_json(), as bytes.
+
+    Built on first use, so importing this module doesn't force the models'
+    deferred schema build.
+    """
+    return TypeAdapter(model)
+
+
+def append_incident(writer: JsonlWriter, incident: AIAAICIncident) -> None:
     """Append a single incident to the JSONL file."""
-    with open(jsonl_path, "a", encoding="utf-8") as f:
-        f.write(incident.model_dump_json() + "\n")
-        f.flush()
+    writer.append(_json_adapter(AIAAICIncident).dump_json(incident))
 
 
-def append_error(errors_path: Path, error: ScrapingError) -> None:
+def append_error(writer: JsonlWriter, error: ScrapingError) -> None:
     """Append a scraping error to the errors JSONL file."""
-    with open(errors_path, "a", encoding="utf-8") as f:
-        f.write(error.model_dump_json() + "\n")
-        f.flush()
+    writer.append(_json_adapter(ScrapingError).dump_json(error))
 
 
 def load_incidents(jsonl_path: Path) -> Iterator[AIAAICIncident]:
@@ -87,32 +219,184 @@ def load_incidents(jsonl_path: Path) -> Iterator[AIAAICIncident]:
     if not jsonl_path.exists():
         return
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
+    with open(jsonl_path, "rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             try:
-                data = json.loads(line)
+                data = orjson.loads(line)
                 yield AIAAICIncident.model_validate(data)
-            except (json.JSONDecodeError, ValueError):
+            except (orjson.JSONDecodeError, ValueError):
                 continue
 
 
+# Below this size, process startup costs more than parsing the file serially
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+def _line_aligned_ranges(jsonl_path: Path, n_chunks: int) -> list[tuple[int, int]]:
+    """Split a file into roughly equal byte ranges that end on newlines."""
+    size = jsonl_path.stat().st_size
+    bounds = [0]
+    with open(jsonl_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, n_chunks):
+            pos = mm.find(b"\n", max(size * i // n_chunks, bounds[-1]))
+            bounds.append(size if pos == -1 else pos + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _load_incident_range(jsonl_path: Path, start: int, end: int) -> list[AIAAICIncident]:
+    """Parse the incidents in one byte range of the JSONL file (worker process)."""
+    with open(jsonl_path, "rb") as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+
+    incidents = []
+    for line in chunk.splitlines():
+        if not line or line.isspace():
+            continue
+        try:
+            data = orjson.loads(line)
+            incidents.append(AIAAICIncident.model_validate(data))
+        except (orjson.JSONDecodeError, ValueError):
+            continue
+    return incidents
+
+
+def load_incidents_parallel(jsonl_path: Path, n_workers: int | None = None) -> Iterator[AIAAICIncident]:
+    """Load all incidents, parsing newline-aligned chunks in worker processes.
+
+    Yields incidents in file order, like load_incidents(). Falls back to the
+    serial loader for small files or when only one worker is available.
+    """
+    if not jsonl_path.exists():
+        return
+
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers <= 1 or jsonl_path.stat().st_size < PARALLEL_MIN_BYTES:
+        yield from load_incidents(jsonl_path)
+        return
+
+    ranges = _line_aligned_ranges(jsonl_path, n_workers)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(_load_incident_range, jsonl_path, start, end) for start, end in ranges]
+        for future in futures:
+            yield from future.result()
+
+
 def export_to_json(jsonl_path: Path, output_path: Path) -> int:
     """Export JSONL to a single JSON array file.
 
+    Records are written one at a time, so memory use doesn't grow with the
+    file. The output matches dumping the whole list with OPT_INDENT_2.
+
     Returns the number of incidents exported.
     """
-    incidents = list(load_incidents(jsonl_path))
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(
-            [incident.model_dump(mode="json") for incident in incidents],
-            f,
-            indent=2,
-            ensure_ascii=False,
+    count = 0
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b"[")
+        for incident in load_incidents(jsonl_path):
+            # JSON strings can't hold a raw newline, so this only indents
+            record = orjson.dumps(incident.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+            f.write(b",\n  " if count else b"\n  ")
+            f.write(record.replace(b"\n", b"\n  "))
+            count += 1
+        f.write(b"\n]" if count else b"]")
+    return count
+
+
+# Define CSV columns (flattening nested structures)
+CSV_FIELDNAMES = [
+    "aiaaic_id",
+    "headline",
+    "occurred",
+    "countries",
+    "sectors",
+    "deployers",
+    "developers",
+    "system_names",
+    "technologies",
+    "purposes",
+    "news_triggers",
+    "issues",
+    "external_harms_individual",
+    "external_harms_societal",
+    "external_harms_environmental",
+    "internal_impacts_strategic_reputational",
+    "internal_impacts_operational",
+    "internal_impacts_financial",
+    "internal_impacts_legal_regulatory",
+    "detail_page_url",
+    "description",
+    "source_links_count",
+    "related_incidents_count",
+    "page_published",
+    "page_scraped",
+    "scraped_at",
+]
+
+# Attributes behind the semicolon-joined columns, in column order; one
+# C-level getter reads all of them per row
+_csv_list_fields = operator.attrgetter(
+    "countries", "sectors", "deployers", "developers", "system_names",
+    "technologies", "purposes", "news_triggers", "issues",
+    "external_harms.individual",
+    "external_harms.societal",
+    "external_harms.environmental",
+    "internal_impacts.strategic_reputational",
+    "internal_impacts.operational",
+    "internal_impacts.financial",
+    "internal_impacts.legal_regulatory",
+)
+
+
+def _csv_row(incident: AIAAICIncident) -> tuple:
+    """Flatten an incident into a CSV row, in CSV_FIELDNAMES order."""
+    return (
+        incident.aiaaic_id,
+        incident.headline,
+        incident.occurred,
+        *map("; ".join, _csv_list_fields(incident)),
+        incident.detail_page_url or "",
+        incident.description or "",
+        len(incident.source_links),
+        len(incident.related_incidents),
+        incident.page_published or "",
+        str(incident.page_scraped),
+        incident.scraped_at.isoformat(),
+    )
+
+
+def _csv_rows_range(jsonl_path: Path, start: int, end: int) -> list[tuple]:
+    """Build the CSV rows for one byte range of the JSONL file (worker process)."""
+    return [_csv_row(incident) for incident in _load_incident_range(jsonl_path, start, end)]
+
+
+def _iter_csv_rows(jsonl_path: Path, n_workers: int | None = None) -> Iterator[tuple]:
+    """Yield CSV rows in file order, built in worker processes for large files.
+
+    Workers send back plain tuples, which pickle far faster than models.
+    The file is cut into several ranges per worker and only a couple of
+    ranges per worker are in flight, so finished rows don't pile up ahead
+    of the writer.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers <= 1 or jsonl_path.stat().st_size < PARALLEL_MIN_BYTES:
+        yield from map(_csv_row, load_incidents(jsonl_path))
+        return
+
+    ranges = iter(_line_aligned_ranges(jsonl_path, n_workers * 4))
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = collections.deque(
+            executor.submit(_csv_rows_range, jsonl_path, start, end)
+            for start, end in itertools.islice(ranges, n_workers * 2)
         )
-    return len(incidents)
+        while pending:
+            rows = pending.popleft().result()
+            for start, end in itertools.islice(ranges, 1):
+                pending.append(executor.submit(_csv_rows_range, jsonl_path, start, end))
+            yield from rows
 
 
 def export_to_csv(jsonl_path: Path, output_path: Path) -> int:
@@ -122,86 +406,31 @@ def export_to_csv(jsonl_path: Path, output_path: Path) -> int:
     """
     import csv
 
-    incidents = list(load_incidents(jsonl_path))
-    if not incidents:
+    if not jsonl_path.exists():
         return 0
 
-    # Define CSV columns (flattening nested structures)
-    fieldnames = [
-        "aiaaic_id",
-        "headline",
-        "occurred",
-        "countries",
-        "sectors",
-        "deployers",
-        "developers",
-        "system_names",
-        "technologies",
-        "purposes",
-        "news_triggers",
-        "issues",
-        "external_harms_individual",
-        "external_harms_societal",
-        "external_harms_environmental",
-        "internal_impacts_strategic_reputational",
-        "internal_impacts_operational",
-        "internal_impacts_financial",
-        "internal_impacts_legal_regulatory",
-        "detail_page_url",
-        "description",
-        "source_links_count",
-        "related_incidents_count",
-        "page_published",
-        "page_scraped",
-        "scraped_at",
-    ]
+    # Streamed like export_to_json(); peek first so an empty input writes no file
+    rows = _iter_csv_rows(jsonl_path)
+    first = next(rows, None)
+    if first is None:
+        return 0
 
+    count = 0
     with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for incident in incidents:
-            row = {
-                "aiaaic_id": incident.aiaaic_id,
-                "headline": incident.headline,
-                "occurred": incident.occurred,
-                "countries": "; ".join(incident.countries),
-                "sectors": "; ".join(incident.sectors),
-                "deployers": "; ".join(incident.deployers),
-                "developers": "; ".join(incident.developers),
-                "system_names": "; ".join(incident.system_names),
-                "technologies": "; ".join(incident.technologies),
-                "purposes": "; ".join(incident.purposes),
-                "news_triggers": "; ".join(incident.news_triggers),
-                "issues": "; ".join(incident.issues),
-                "external_harms_individual": "; ".join(incident.external_harms.individual),
-                "external_harms_societal": "; ".join(incident.external_harms.societal),
-                "external_harms_environmental": "; ".join(incident.external_harms.environmental),
-                "internal_impacts_strategic_reputational": "; ".join(
-                    incident.internal_impacts.strategic_reputational
-                ),
-                "internal_impacts_operational": "; ".join(incident.internal_impacts.operational),
-                "internal_impacts_financial": "; ".join(incident.internal_impacts.financial),
-                "internal_impacts_legal_regulatory": "; ".join(
-                    incident.internal_impacts.legal_regulatory
-                ),
-                "detail_page_url": incident.detail_page_url or "",
-                "description": incident.description or "",
-                "source_links_count": len(incident.source_links),
-                "related_incidents_count": len(incident.related_incidents),
-                "page_published": incident.page_published or "",
-                "page_scraped": str(incident.page_scraped),
-                "scraped_at": incident.scraped_at.isoformat(),
-            }
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        for row in itertools.chain([first], rows):
             writer.writerow(row)
+            count += 1
 
-    return len(incidents)
+    return count
 
 
 def clear_errors(errors_path: Path) -> None:
     """Clear the errors file."""
     if errors_path.exists():
         errors_path.unlink()
+    _ids_sidecar(errors_path).unlink(missing_ok=True)
 
 
 def remove_ids_from_jsonl(jsonl_path: Path, ids_to_remove: set[str]) -> int:
@@ -214,32 +443,90 @@ def remove_ids_from_jsonl(jsonl_path: Path, ids_to_remove: set[str]) -> int:
     if not jsonl_path.exists() or not ids_to_remove:
         return 0
 
-    # Read all records, filtering out the ones to remove
-    records_to_keep = []
+    # Stream the records to keep into a sibling file, then swap it in
     removed_count = 0
+    tmp_path = jsonl_path.with_suffix(".tmp")
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+    with open(jsonl_path, "rb") as src, open(tmp_path, "wb") as dst:
+        for line in src:
+            if line.isspace():
                 continue
-            try:
-                data = json.loads(line)
-                if data.get("aiaaic_id") in ids_to_remove:
-                    removed_count += 1
-                else:
-                    records_to_keep.append(line)
-            except json.JSONDecodeError:
-                records_to_keep.append(line)  # Keep malformed lines
-
-    # Write back
-    with open(jsonl_path, "w", encoding="utf-8") as f:
-        for line in records_to_keep:
-            f.write(line + "\n")
+            match = _ID_RE.search(line)
+            if match:
+                aiaaic_id = match.group(1).decode()
+            else:
+                try:
+                    aiaaic_id = orjson.loads(line).get("aiaaic_id")
+                except orjson.JSONDecodeError:
+                    aiaaic_id = None  # Keep malformed lines
+            if aiaaic_id in ids_to_remove:
+                removed_count += 1
+                continue
+            dst.write(line if line.endswith(b"\n") else line + b"\n")
+
+    if removed_count:
+        os.replace(tmp_path, jsonl_path)
+        _ids_sidecar(jsonl_path).unlink(missing_ok=True)
+    else:
+        tmp_path.unlink()
 
     return removed_count
 
 
+# === INCOMPLETE RECORDS ===
+
+
+@dataclass
+class IncompleteRecord:
+    """A scraped incident with missing page data."""
+
+    aiaaic_id: str
+    headline: str
+    missing: list[str]  # "description", "sources" or "short description"
+
+
+def find_incomplete(
+    jsonl_path: Path, min_desc_length: int | None = None
+) -> tuple[int, list[IncompleteRecord]]:
+    """Find scraped incidents with missing description or sources.
+
+    With min_desc_length, otherwise complete records whose description is
+    shorter are reported as "short description". Records are checked as raw
+    JSON dicts (no model validation), since only four fields are needed.
+
+    Returns (scraped_count, incomplete records in file order).
+    """
+    scraped = 0
+    incomplete = []
+    if not jsonl_path.exists():
+        return scraped, incomplete
+
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            if line.isspace():
+                continue
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(data, dict) or not data.get("page_scraped"):
+                continue
+            scraped += 1
+            description = data.get("description")
+            missing = []
+            if not description:
+                missing.append("description")
+            if not data.get("source_links"):
+                missing.append("sources")
+            # Note: related_incidents can legitimately be empty, so not checked
+            if not missing and min_desc_length and len(description) < min_desc_length:
+                missing.append("short description")
+            if missing:
+                incomplete.append(IncompleteRecord(data.get("aiaaic_id", ""), data.get("headline", ""), missing))
+
+    return scraped, incomplete
+
+
 # === DATA CONSISTENCY CHECKING ===
 
 
@@ -276,6 +563,62 @@ class ConsistencyReport:
         return bool(self.duplicate_groups) or self.malformed_lines > 0 or self.records_without_id > 0
 
 
+def _record_score(incident: AIAAICIncident) -> tuple:
+    """Score a duplicate record: newest scrape first, then data quality."""
+    quality = 0
+    if incident.description:
+        quality += len(incident.description)
+    if incident.source_links:
+        quality += len(incident.source_links) * 100
+    if incident.page_scraped:
+        quality += 1000
+    return (incident.scraped_at or datetime.min, quality)
+
+
+def _group_lines(jsonl_path: Path) -> tuple[dict[str, list[bytes]], list[bytes], list[bytes]]:
+    """Group the non-blank lines of a JSONL file by AIAAIC ID, in file order.
+
+    IDs are read with _ID_RE, so a line is only JSON-parsed when the regex
+    misses. Returns (lines_by_id, lines_without_id, malformed_lines).
+    """
+    lines_by_id: dict[str, list[bytes]] = {}
+    no_id: list[bytes] = []
+    malformed: list[bytes] = []
+
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            match = _ID_RE.search(line)
+            if match:
+                aiaaic_id = match.group(1).decode()
+            else:
+                try:
+                    aiaaic_id = orjson.loads(line).get("aiaaic_id")
+                except orjson.JSONDecodeError:
+                    malformed.append(line)
+                    continue
+            if aiaaic_id:
+                lines_by_id.setdefault(aiaaic_id, []).append(line)
+            else:
+                no_id.append(line)
+
+    return lines_by_id, no_id, malformed
+
+
+def _validate_lines(lines: list[bytes]) -> tuple[list[tuple[bytes, AIAAICIncident]], list[bytes]]:
+    """Validate lines into incidents. Returns (valid (line, incident) pairs, invalid lines)."""
+    valid: list[tuple[bytes, AIAAICIncident]] = []
+    invalid: list[bytes] = []
+    for line in lines:
+        try:
+            valid.append((line, AIAAICIncident.model_validate(orjson.loads(line))))
+        except ValueError:  # Includes orjson.JSONDecodeError
+            invalid.append(line)
+    return valid, invalid
+
+
 def check_consistency(jsonl_path: Path) -> ConsistencyReport:
     """Check JSONL file for data consistency issues.
 
@@ -295,63 +638,33 @@ def check_consistency(jsonl_path: Path) -> ConsistencyReport:
             records_without_id=0,
         )
 
-    # Group records by ID
-    records_by_id: dict[str, list[AIAAICIncident]] = {}
-    malformed = 0
-    no_id = 0
-    total = 0
+    lines_by_id, no_id, malformed_lines = _group_lines(jsonl_path)
+    total = sum(map(len, lines_by_id.values())) + len(no_id) + len(malformed_lines)
+    malformed = len(malformed_lines)
+    unique_ids = 0
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            total += 1
-            try:
-                data = json.loads(line)
-                aiaaic_id = data.get("aiaaic_id")
-                if not aiaaic_id:
-                    no_id += 1
-                    continue
-                incident = AIAAICIncident.model_validate(data)
-                records_by_id.setdefault(aiaaic_id, []).append(incident)
-            except json.JSONDecodeError:
-                malformed += 1
-            except ValueError:
-                malformed += 1
-
-    # Find duplicates and determine best record for each
+    # Every record is validated, so schema errors count as malformed too
     duplicate_groups = []
-    for aiaaic_id, records in records_by_id.items():
-        if len(records) > 1:
-            # Sort by scraped_at (newest first), then by data quality
-            def score(r: AIAAICIncident) -> tuple:
-                """Score record by quality (higher = better)."""
-                quality = 0
-                if r.description:
-                    quality += len(r.description)
-                if r.source_links:
-                    quality += len(r.source_links) * 100
-                if r.page_scraped:
-                    quality += 1000
-                return (r.scraped_at or datetime.min, quality)
-
-            sorted_records = sorted(records, key=score, reverse=True)
-            best = sorted_records[0]
-
+    for aiaaic_id, lines in lines_by_id.items():
+        valid, invalid = _validate_lines(lines)
+        malformed += len(invalid)
+        if valid:
+            unique_ids += 1
+        if len(valid) > 1:
+            records = [incident for _, incident in valid]
             duplicate_groups.append(DuplicateGroup(
                 aiaaic_id=aiaaic_id,
                 records=records,
-                best_record=best,
+                best_record=max(records, key=_record_score),
                 removed_count=len(records) - 1,
             ))
 
     return ConsistencyReport(
         total_records=total,
-        unique_ids=len(records_by_id),
+        unique_ids=unique_ids,
         duplicate_groups=duplicate_groups,
         malformed_lines=malformed,
-        records_without_id=no_id,
+        records_without_id=len(no_id),
     )
 
 
@@ -362,6 +675,9 @@ def deduplicate_jsonl(jsonl_path: Path, dry_run: bool = False) -> tuple[int, int
     1. Most recent scraped_at timestamp
     2. Highest data quality (longer description, more sources)
 
+    Only records that share an ID are validated; a unique record is kept
+    as-is without building its model.
+
     Args:
         jsonl_path: Path to the JSONL file
         dry_run: If True, report what would be removed without modifying file
@@ -372,58 +688,32 @@ def deduplicate_jsonl(jsonl_path: Path, dry_run: bool = False) -> tuple[int, int
     if not jsonl_path.exists():
         return 0, 0
 
-    # Load all records grouped by ID
-    records_by_id: dict[str, list[tuple[str, AIAAICIncident]]] = {}  # id -> [(line, incident)]
-    malformed_lines: list[str] = []
-
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                aiaaic_id = data.get("aiaaic_id")
-                if not aiaaic_id:
-                    malformed_lines.append(line)
-                    continue
-                incident = AIAAICIncident.model_validate(data)
-                records_by_id.setdefault(aiaaic_id, []).append((line, incident))
-            except (json.JSONDecodeError, ValueError):
-                malformed_lines.append(line)
+    lines_by_id, no_id, malformed_lines = _group_lines(jsonl_path)
 
     # Select best record for each ID
-    lines_to_keep: list[str] = []
+    lines_to_keep: list[bytes] = []
     removed_count = 0
 
-    for aiaaic_id, records in records_by_id.items():
-        if len(records) == 1:
-            lines_to_keep.append(records[0][0])
-        else:
-            # Score and sort
-            def score(r: tuple[str, AIAAICIncident]) -> tuple:
-                inc = r[1]
-                quality = 0
-                if inc.description:
-                    quality += len(inc.description)
-                if inc.source_links:
-                    quality += len(inc.source_links) * 100
-                if inc.page_scraped:
-                    quality += 1000
-                return (inc.scraped_at or datetime.min, quality)
-
-            sorted_records = sorted(records, key=score, reverse=True)
-            lines_to_keep.append(sorted_records[0][0])
-            removed_count += len(records) - 1
+    for lines in lines_by_id.values():
+        if len(lines) == 1:
+            lines_to_keep.append(lines[0])
+            continue
+        valid, invalid = _validate_lines(lines)
+        malformed_lines.extend(invalid)
+        if valid:
+            lines_to_keep.append(max(valid, key=lambda r: _record_score(r[1]))[0])
+            removed_count += len(valid) - 1
 
     # Keep malformed lines (don't lose data)
+    lines_to_keep.extend(no_id)
     lines_to_keep.extend(malformed_lines)
 
     if not dry_run:
-        with open(jsonl_path, "w", encoding="utf-8") as f:
-            for line in lines_to_keep:
-                f.write(line + "\n")
+        tmp_path = jsonl_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            if lines_to_keep:
+                f.write(b"\n".join(lines_to_keep) + b"\n")
+        os.replace(tmp_path, jsonl_path)
+        _ids_sidecar(jsonl_path).unlink(missing_ok=True)
 
     return len(lines_to_keep), removed_count
-
-
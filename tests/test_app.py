@@ -0,0 +1,51 @@
+"""Tests for the Streamlit app's data helpers (run in Streamlit's bare mode)."""
+
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    """Import app.py against a data file where --update appended duplicates."""
+    workdir = tmp_path_factory.mktemp("app")
+    (workdir / "data").mkdir()
+    records = [{"aiaaic_id": f"AIAAIC{i}", "headline": f"Headline {i}", "occurred": "2024",
+                "countries": ["France"]} for i in (1, 2, 3)]
+    with open(workdir / "data" / "aiaaic_incidents.jsonl", "w", encoding="utf-8") as f:
+        for record in records + records[:2] * 2:
+            f.write(json.dumps(record) + "\n")
+
+    cwd = os.getcwd()
+    os.chdir(workdir)  # app.py resolves data/ relative to the working directory
+    sys.path.insert(0, str(ROOT))
+    try:
+        yield importlib.import_module("app")
+    finally:
+        sys.path.remove(str(ROOT))
+        os.chdir(cwd)
+
+
+def test_duplicated_records_keep_string_ids(app):
+    df = app.get_data()
+    assert len(df) == 7
+    assert not isinstance(df["aiaaic_id"].dtype, app.pd.CategoricalDtype)
+    assert not isinstance(df["headline"].dtype, app.pd.CategoricalDtype)
+
+
+def test_search_index_with_duplicated_records(app):
+    index = app.search_index(app.get_data())
+    assert index.iloc[0] == "headline 1\naiaaic1\nfrance\n"
+    assert index.str.contains("aiaaic3", regex=False).sum() == 1
+
+
+def test_compute_metrics_lists_only_duplicated_ids(app):
+    metrics = app.compute_metrics(app.get_data())
+    assert sorted(metrics["duplicates"]) == ["AIAAIC1", "AIAAIC2"]
+    assert metrics["duplicate_count"] == 2